@@ -0,0 +1,76 @@
+"""
+Measure the time and peak Python memory of building the HTML report from a large
+event stream, to check that ReportBuilder stays bounded in memory.
+
+A synthetic stream is written to a temporary directory: every test has a start
+event, a few page actions and an outcome, and one test in a thousand fails.
+Peak memory is traced with tracemalloc, which also slows the build down.
+
+Usage:
+    python benchmarks/report_memory.py --tests 100000
+    python benchmarks/report_memory.py --tests 100000 --actions 20
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.utils.logger import configure_logging  # noqa: E402
+from src.utils.report_builder import ReportBuilder  # noqa: E402
+
+ACTIONS = ["navigate_to", "find_element", "click", "type_text", "get_text"]
+
+
+def write_stream(path, tests, actions):
+    """
+    Write a synthetic event stream of `tests` tests with `actions` page actions each.
+    """
+    with open(path, "w", encoding="utf-8") as events:
+        for i in range(tests):
+            test = f"tests/test_bulk.py::test_case[{i}]"
+            events.write(json.dumps({"event": "test_start", "ts": i, "test": test}) + "\n")
+            for j in range(actions):
+                events.write(json.dumps({"event": "action", "ts": i, "test": test, "action": ACTIONS[j % len(ACTIONS)],
+                                         "locator": ["id", f"field-{j}"], "duration": 0.01}) + "\n")
+            failed = i % 1000 == 0
+            events.write(json.dumps({"event": "test_finish", "ts": i, "test": test,
+                                     "outcome": "failed" if failed else "passed", "duration": (i % 97) / 10,
+                                     "message": "AssertionError: boom" if failed else None}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=100_000)
+    parser.add_argument("--actions", type=int, default=3, help="page actions per test")
+    args = parser.parse_args()
+    configure_logging()
+
+    with tempfile.TemporaryDirectory() as directory:
+        events_path = os.path.join(directory, "events.jsonl")
+        report_path = os.path.join(directory, "report.html")
+        write_stream(events_path, args.tests, args.actions)
+
+        started = time.perf_counter()
+        tracemalloc.start()
+        outcomes = ReportBuilder(events_path).build(report_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        elapsed = time.perf_counter() - started
+
+        print(f"{'tests':<24} {args.tests:>12}")
+        print(f"{'outcomes':<24} {str(outcomes):>12}")
+        print(f"{'event stream MB':<24} {os.path.getsize(events_path) / 2 ** 20:>12.1f}")
+        print(f"{'report MB':<24} {os.path.getsize(report_path) / 2 ** 20:>12.1f}")
+        print(f"{'build time s':<24} {elapsed:>12.1f}")
+        print(f"{'peak traced memory MB':<24} {peak / 2 ** 20:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
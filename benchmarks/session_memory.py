@@ -0,0 +1,162 @@
+"""
+Measure browser memory over a long run of simulated tests sharing one driver,
+with and without session hygiene policies.
+
+Fixture pages are served from a local HTTP server. Each page grows the DOM,
+writes to localStorage and sometimes opens a popup that is never closed,
+which mimics what real suites leave behind in a reused session.
+
+Usage:
+    python benchmarks/session_memory.py --tests 1000 --policies none,hygiene
+    python benchmarks/session_memory.py --tests 1000 --policies hygiene --restart-after-navigations 300
+
+One CSV per policy (test, rss_mb, restarts) is written to reports/memory/.
+"""
+import argparse
+import csv
+import functools
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.drivers.driver_factory import DriverFactory  # noqa: E402
+from src.drivers.driver_health import DriverWatchdog, process_tree  # noqa: E402
+from src.drivers.session_hygiene import HygienePolicy, SessionHygiene  # noqa: E402
+from src.pages.base_page import BasePage  # noqa: E402
+from src.utils.logger import configure_logging  # noqa: E402
+
+FIXTURE_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Fixture {index}</title></head>
+<body>
+<button id="grow" onclick="grow()">grow</button>
+<div id="content"></div>
+<script>
+function grow() {{
+    var content = document.getElementById('content');
+    for (var i = 0; i < 2000; i++) {{
+        var row = document.createElement('div');
+        row.className = 'row';
+        row.textContent = 'row ' + i + ' of page {index}';
+        content.appendChild(row);
+    }}
+    try {{ localStorage.setItem('page-{index}-' + Date.now(), new Array(20000).join('x')); }} catch (e) {{}}
+}}
+if ({index} % 25 === 0) {{ window.open('/page_{next}.html', '_blank'); }}
+</script>
+</body>
+</html>
+"""
+
+PAGE_COUNT = 50
+
+
+def write_fixture_pages(directory):
+    for index in range(PAGE_COUNT):
+        with open(os.path.join(directory, f"page_{index}.html"), "w", encoding="utf-8") as f:
+            f.write(FIXTURE_PAGE.format(index=index, next=(index + 1) % PAGE_COUNT))
+
+
+def serve(directory):
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def rss_mb(driver):
+    total = 0
+    for process in process_tree(driver):
+        try:
+            total += process.memory_info().rss
+        except Exception:
+            pass
+    return total / (1024 * 1024)
+
+
+def run(policy_name, policy, tests, base_url, output_dir):
+    hygiene = SessionHygiene(policy) if policy else None
+    watchdog = DriverWatchdog(lambda: DriverFactory.get_driver("web"), hygiene=hygiene)
+    rows = []
+    started = time.perf_counter()
+    try:
+        for test in range(tests):
+            driver = watchdog.ensure_healthy()
+            page = BasePage(driver)
+            page.navigate_to(f"{base_url}/page_{test % PAGE_COUNT}.html")
+            page.click(("id", "grow"))
+            rows.append((test, round(rss_mb(driver), 1), watchdog.metrics["restarts"]))
+    finally:
+        watchdog.quit()
+
+    path = os.path.join(output_dir, f"{policy_name}.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["test", "rss_mb", "restarts"])
+        writer.writerows(rows)
+
+    samples = [row[1] for row in rows]
+    return {
+        "policy": policy_name,
+        "start_mb": samples[0] if samples else 0.0,
+        "peak_mb": max(samples) if samples else 0.0,
+        "final_mb": samples[-1] if samples else 0.0,
+        "restarts": watchdog.metrics["restarts"],
+        "seconds": time.perf_counter() - started,
+        "csv": path,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=1000)
+    parser.add_argument("--policies", default="none,hygiene", help="comma separated: none, hygiene")
+    parser.add_argument("--restart-after-navigations", type=int, default=200)
+    parser.add_argument("--restart-above-rss-mb", type=float, default=1500)
+    parser.add_argument("--close-tabs-every", type=int, default=5)
+    parser.add_argument("--clear-storage-every", type=int, default=10)
+    parser.add_argument("--output-dir", default=os.path.join("reports", "memory"))
+    args = parser.parse_args()
+    configure_logging()
+
+    policies = {
+        "none": None,
+        "hygiene": HygienePolicy(
+            restart_after_navigations=args.restart_after_navigations,
+            restart_above_rss_mb=args.restart_above_rss_mb,
+            close_tabs_every=args.close_tabs_every,
+            clear_storage_every=args.clear_storage_every,
+        ),
+    }
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as fixtures:
+        write_fixture_pages(fixtures)
+        server = serve(fixtures)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            results = [run(name, policies[name], args.tests, base_url, args.output_dir)
+                       for name in args.policies.split(",")]
+        finally:
+            server.shutdown()
+
+    print(f"{'policy':<10} {'start MB':>9} {'peak MB':>9} {'final MB':>9} {'restarts':>9} {'seconds':>9}")
+    for result in results:
+        print(f"{result['policy']:<10} {result['start_mb']:>9.0f} {result['peak_mb']:>9.0f} "
+              f"{result['final_mb']:>9.0f} {result['restarts']:>9} {result['seconds']:>9.1f}  {result['csv']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Measure the import and test-collection cost of the framework, optionally
+comparing the working tree against another git revision.
+
+For each entry module the cumulative import time reported by
+`python -X importtime` is taken; collection time is the wall time of
+`pytest --collect-only` on the unit tests. Each measurement is repeated
+and the median is reported.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --against baseline-ref --repeat 7
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+ENTRY_MODULES = [
+    "src.drivers.driver_factory",
+    "src.utils.excel_reader",
+    "src.pages.base_page",
+]
+
+COLLECT_COMMAND = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", "tests/unit"]
+
+
+def import_time_ms(root, module):
+    """
+    Cumulative import time of a module in a fresh interpreter, in milliseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=root),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    for line in reversed(result.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def collection_time_ms(root):
+    """
+    Wall time of collecting the unit tests in a fresh interpreter, in milliseconds.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(COLLECT_COMMAND, cwd=root, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"Collection failed:\n{result.stdout[-2000:]}")
+    return elapsed
+
+
+def measure(root, repeat):
+    results = {}
+    for module in ENTRY_MODULES:
+        results[f"import {module}"] = statistics.median(import_time_ms(root, module) for _ in range(repeat))
+    results["collect tests/unit"] = statistics.median(collection_time_ms(root) for _ in range(repeat))
+    return results
+
+
+def checkout(ref):
+    directory = tempfile.mkdtemp(prefix="startup-bench-")
+    subprocess.run(["git", "worktree", "add", "--detach", directory, ref],
+                   cwd=project_root, check=True, capture_output=True)
+    return directory
+
+
+def remove_checkout(directory):
+    subprocess.run(["git", "worktree", "remove", "--force", directory], cwd=project_root, capture_output=True)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--against", help="git revision to compare the working tree with")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    current = measure(project_root, args.repeat)
+    before = None
+    if args.against:
+        directory = checkout(args.against)
+        try:
+            before = measure(directory, args.repeat)
+        finally:
+            remove_checkout(directory)
+
+    if before is None:
+        print(f"{'measurement':<40} {'ms':>10}")
+        for name, value in current.items():
+            print(f"{name:<40} {value:>10.1f}")
+        return
+
+    print(f"{'measurement':<40} {args.against + ' ms':>14} {'current ms':>12} {'speedup':>8}")
+    for name, value in current.items():
+        old = before[name]
+        print(f"{name:<40} {old:>14.1f} {value:>12.1f} {old / value if value else 0:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,9 +20,53 @@ CONFIG = {
     "BROWSERSTACK_APP_ID": os.getenv("BROWSERSTACK_APP_ID", "bs://<app-id>"),
     "MOBILE_PLATFORM_NAME": os.getenv("MOBILE_PLATFORM_NAME", "Android"),
 
-    # URL for Appium server (if needed in future for local mobile testing)
+    # URL for the local Appium server used for local mobile testing
     "APPIUM_SERVER_URL": os.getenv("APPIUM_SERVER_URL", "http://localhost:4723/wd/hub"),
 
+    # Local mobile app: path of the app to install, its package / bundle id, the automation
+    # engine (defaults to UiAutomator2 or XCUITest) and the reset policy between tests:
+    # noReset, terminate (keep installed, terminate and activate) or fullReset (reinstall)
+    "MOBILE_APP_PATH": os.getenv("MOBILE_APP_PATH", ""),
+    "MOBILE_APP_ID": os.getenv("MOBILE_APP_ID", ""),
+    "MOBILE_AUTOMATION_NAME": os.getenv("MOBILE_AUTOMATION_NAME", ""),
+    "MOBILE_RESET_POLICY": os.getenv("MOBILE_RESET_POLICY", "terminate"),
+
+    # Watchdog limits for long-lived local driver sessions (0 disables the RSS limit)
+    "DRIVER_PING_TIMEOUT": float(os.getenv("DRIVER_PING_TIMEOUT", "5")),
+    "DRIVER_MAX_RSS_MB": float(os.getenv("DRIVER_MAX_RSS_MB", "0")),
+
+    # Session hygiene for shared drivers: restart after N navigations or X MB of RSS,
+    # close extra tabs and clear cache/storage every N tests (0 disables a rule)
+    "HYGIENE_RESTART_AFTER_NAVIGATIONS": int(os.getenv("HYGIENE_RESTART_AFTER_NAVIGATIONS", "0")),
+    "HYGIENE_RESTART_ABOVE_RSS_MB": float(os.getenv("HYGIENE_RESTART_ABOVE_RSS_MB", "0")),
+    "HYGIENE_CLOSE_TABS_EVERY": int(os.getenv("HYGIENE_CLOSE_TABS_EVERY", "0")),
+    "HYGIENE_CLEAR_STORAGE_EVERY": int(os.getenv("HYGIENE_CLEAR_STORAGE_EVERY", "0")),
+
+    # Record locator timings and match counts through BasePage and write per-page reports
+    "ANALYZE_LOCATORS": os.getenv("ANALYZE_LOCATORS", "False") == "True",
+
+    # Test impact selection: IMPACT_TRACKING records per-test dependencies into IMPACT_INDEX and,
+    # when IMPACT_BASE_REF is set, only the tests affected by changes since that git revision run
+    "IMPACT_TRACKING": os.getenv("IMPACT_TRACKING", "False") == "True",
+    "IMPACT_INDEX": os.getenv("IMPACT_INDEX", os.path.join("reports", "impact", "index.json")),
+    "IMPACT_BASE_REF": os.getenv("IMPACT_BASE_REF", ""),
+
+    # Run history (SQLite) used for fail-fast ordering and duration-balanced shards:
+    # TEST_ORDER=fail-fast runs recent failures then fastest tests first, SHARD=i/n runs shard i of n.
+    # All shard runners must use the same HISTORY_DB and SHARD_BASE_RUN (python -m src.utils.run_history
+    # --latest-run, taken before the shards start); without a base run or HISTORY_DB tests are split by node id hash.
+    # Disabled unless set, e.g. HISTORY_DB=reports/history/history.db
+    "HISTORY_DB": os.getenv("HISTORY_DB", ""),
+    "TEST_ORDER": os.getenv("TEST_ORDER", ""),
+    "SHARD": os.getenv("SHARD", ""),
+    "SHARD_BASE_RUN": int(os.getenv("SHARD_BASE_RUN", "0")) or None,
+
+    # Structured event stream (JSON lines) appended during the run, and the HTML report
+    # rendered from it at the end of the session. Disabled unless EVENT_LOG is set,
+    # e.g. EVENT_LOG=reports/events/events.jsonl; an empty HTML_REPORT skips the report
+    "EVENT_LOG": os.getenv("EVENT_LOG", ""),
+    "HTML_REPORT": os.getenv("HTML_REPORT", os.path.join("reports", "html", "report.html")),
+
     # Base URL for the web application under test (to be set later)
     "BASE_URL": os.getenv("BASE_URL", "https://your-application-url.com"),
 }
\ No newline at end of file
@@ -0,0 +1,98 @@
+import time
+from src.config.config import CONFIG
+from src.drivers.driver_factory import DriverFactory, MOBILE_RESET_POLICIES
+from src.utils.logger import get_logger
+
+
+class AppiumSessionManager:
+    """
+    AppiumSessionManager keeps one local Appium session alive across tests and resets
+    the app between them according to the reset policy, instead of creating a new
+    session (and reinstalling the app) for every test.
+
+      - noReset:   the session and app state are kept as they are.
+      - terminate: the app is terminated and activated again, so it restarts clean but stays installed.
+      - fullReset: a new session, reinstalling the app, is created for every test.
+
+    Example usage:
+        manager = AppiumSessionManager(reset_policy="terminate", app_id="com.example.app")
+        driver = manager.acquire()   # before each test
+        ...
+        manager.release()            # after each test
+        manager.quit()
+    """
+
+    def __init__(self, reset_policy=None, app_id=None, factory=None):
+        """
+        :param reset_policy: One of MOBILE_RESET_POLICIES; defaults to CONFIG['MOBILE_RESET_POLICY'].
+        :param app_id: Package / bundle id of the app; defaults to CONFIG['MOBILE_APP_ID'].
+        :param factory: Optional callable returning a new driver; defaults to a local Appium session.
+        :raises ValueError: If the policy is unknown, or 'terminate' is used without an app id.
+        """
+        self.reset_policy = reset_policy or CONFIG.get("MOBILE_RESET_POLICY", "terminate")
+        if self.reset_policy not in MOBILE_RESET_POLICIES:
+            raise ValueError(f"Unsupported reset policy: {self.reset_policy}. Use one of {MOBILE_RESET_POLICIES}.")
+        self.app_id = app_id or CONFIG.get("MOBILE_APP_ID")
+        if self.reset_policy == "terminate" and not self.app_id:
+            raise ValueError("MOBILE_APP_ID is required for the 'terminate' reset policy.")
+        self.factory = factory or (lambda: DriverFactory.get_local_mobile_driver(self.reset_policy))
+        self.logger = get_logger(self.__class__.__name__)
+        self.metrics = {"sessions": 0, "session_time": 0.0, "resets": 0, "reset_time": 0.0}
+        self._driver = None
+
+    def acquire(self):
+        """
+        Return the driver for the next test, starting a session if none is alive.
+
+        :return: Appium driver instance
+        """
+        if self._driver is None:
+            started = time.perf_counter()
+            self._driver = self.factory()
+            self.metrics["sessions"] += 1
+            self.metrics["session_time"] += time.perf_counter() - started
+            self.logger.info(f"Started Appium session {self._driver.session_id} ({self.reset_policy})")
+        return self._driver
+
+    def release(self):
+        """
+        Reset the app after a test according to the reset policy. If the reset fails,
+        the session is dropped so that the next test starts a fresh one.
+        """
+        if self._driver is None:
+            return
+        if self.reset_policy == "fullReset":
+            self.quit()
+            return
+        if self.reset_policy == "noReset":
+            return
+        started = time.perf_counter()
+        try:
+            self._driver.terminate_app(self.app_id)
+            self._driver.activate_app(self.app_id)
+        except Exception as e:
+            self.logger.warning(f"App reset failed, dropping the session: {e}")
+            self.quit()
+            return
+        self.metrics["resets"] += 1
+        self.metrics["reset_time"] += time.perf_counter() - started
+
+    def quit(self):
+        """
+        End the current session, if any.
+        """
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.warning(f"Failed to quit Appium session: {e}")
+
+    def summary(self):
+        """
+        Return a one-line summary of sessions created and resets performed.
+        """
+        sessions, resets = self.metrics["sessions"], self.metrics["resets"]
+        return (f"policy={self.reset_policy} sessions={sessions} "
+                f"avg_session_start={self.metrics['session_time'] / sessions if sessions else 0:.2f}s "
+                f"resets={resets} avg_reset={self.metrics['reset_time'] / resets if resets else 0:.2f}s")
@@ -0,0 +1,248 @@
+import threading
+import time
+from src.config.config import CONFIG
+from src.utils.logger import get_logger
+
+try:
+    import psutil
+except ImportError:  # Process metrics are skipped when psutil is not installed.
+    psutil = None
+
+
+class HealthStatus:
+    """
+    Result of a single health check of a driver session.
+    """
+
+    def __init__(self, healthy, reason=None, rss_mb=None, cpu_percent=None):
+        self.healthy = healthy
+        self.reason = reason
+        self.rss_mb = rss_mb
+        self.cpu_percent = cpu_percent
+
+    def __repr__(self):
+        return (f"HealthStatus(healthy={self.healthy}, reason={self.reason!r}, "
+                f"rss_mb={self.rss_mb}, cpu_percent={self.cpu_percent})")
+
+
+class DriverWatchdog:
+    """
+    DriverWatchdog owns a long-lived driver session and checks it between tests.
+    A session that does not answer a ping, has crashed, or whose driver and browser
+    processes exceed the configured RSS or CPU limits is killed and replaced.
+
+    Example usage:
+        watchdog = DriverWatchdog(lambda: DriverFactory.get_driver("web"), max_rss_mb=1500)
+        driver = watchdog.ensure_healthy()   # before each test
+        ...
+        watchdog.quit()
+        print(watchdog.summary())
+    """
+
+    def __init__(self, factory, ping_timeout=None, max_rss_mb=None, max_cpu_percent=None, hygiene=None):
+        """
+        Initialize the watchdog. The driver is started lazily on first use.
+
+        :param factory: Callable returning a new driver instance.
+        :param ping_timeout: Seconds to wait for a ping before the session is considered hung.
+        :param max_rss_mb: RSS limit in MB for the driver process and all its children (browser).
+        :param max_cpu_percent: CPU usage limit for the process tree since the previous check.
+        :param hygiene: Optional SessionHygiene applied after each successful check.
+        """
+        self.factory = factory
+        self.ping_timeout = ping_timeout or CONFIG.get("DRIVER_PING_TIMEOUT", 5)
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else CONFIG.get("DRIVER_MAX_RSS_MB", 0)
+        if hygiene is not None and hygiene.policy.restart_above_rss_mb and max_rss_mb is None:
+            self.max_rss_mb = hygiene.policy.restart_above_rss_mb
+        self.max_cpu_percent = max_cpu_percent
+        self.hygiene = hygiene
+        self.logger = get_logger(self.__class__.__name__)
+        self.metrics = {
+            "checks": 0,
+            "restarts": 0,
+            "restart_reasons": [],
+            "peak_rss_mb": 0.0,
+            "rss_growth_mb": [],
+        }
+        self._driver = None
+        self._processes = {}
+        self._start_rss_mb = None
+        self._last_rss_mb = None
+
+    @property
+    def driver(self):
+        """
+        The current driver, started on first access.
+        """
+        if self._driver is None:
+            self._start()
+        return self._driver
+
+    def check(self):
+        """
+        Ping the current session and sample the RSS and CPU of its process tree.
+
+        :return: HealthStatus
+        """
+        self.metrics["checks"] += 1
+        driver = self.driver
+        error = ping(driver, self.ping_timeout)
+        if error:
+            return HealthStatus(False, error)
+
+        rss_mb, cpu_percent = self._sample()
+        status = HealthStatus(True, None, rss_mb, cpu_percent)
+        if rss_mb is not None:
+            self._last_rss_mb = rss_mb
+            if self._start_rss_mb is None:
+                self._start_rss_mb = rss_mb
+            self.metrics["peak_rss_mb"] = max(self.metrics["peak_rss_mb"], rss_mb)
+            if self.max_rss_mb and rss_mb > self.max_rss_mb:
+                status.healthy = False
+                status.reason = f"rss {rss_mb:.0f} MB over limit {self.max_rss_mb} MB"
+        if cpu_percent is not None and self.max_cpu_percent and cpu_percent > self.max_cpu_percent:
+            status.healthy = False
+            status.reason = f"cpu {cpu_percent:.0f}% over limit {self.max_cpu_percent}%"
+        return status
+
+    def ensure_healthy(self):
+        """
+        Check the session and replace it if it is unhealthy, then apply the hygiene policy.
+
+        :return: A healthy driver.
+        """
+        status = self.check()
+        if not status.healthy:
+            self.restart(status.reason)
+        elif self.hygiene is not None:
+            self.hygiene.apply(self)
+        return self._driver
+
+    def restart(self, reason):
+        """
+        Kill the current session and start a new one.
+
+        :param reason: Why the session is being replaced; kept in the metrics.
+        """
+        self.logger.warning(f"Restarting driver session: {reason}")
+        self.metrics["restarts"] += 1
+        self.metrics["restart_reasons"].append(reason)
+        self._kill()
+        self._start()
+
+    def quit(self):
+        """
+        Quit the current session, if any.
+        """
+        if self._driver is not None:
+            self._kill()
+
+    def summary(self):
+        """
+        Return a one-line summary of the watchdog metrics.
+        """
+        growth = self.metrics["rss_growth_mb"]
+        average_growth = sum(growth) / len(growth) if growth else 0.0
+        summary = (f"checks={self.metrics['checks']} restarts={self.metrics['restarts']} "
+                   f"peak_rss={self.metrics['peak_rss_mb']:.0f}MB avg_rss_growth={average_growth:.0f}MB "
+                   f"reasons={self.metrics['restart_reasons']}")
+        if self.hygiene is not None:
+            summary += (f" tabs_closed={self.hygiene.metrics['tabs_closed']} "
+                        f"storage_clears={self.hygiene.metrics['storage_clears']}")
+        return summary
+
+    def _start(self):
+        self._driver = self.factory()
+        if self.hygiene is not None:
+            self.hygiene.attach(self._driver)
+        self._processes = {}
+        self._start_rss_mb = None
+        self._last_rss_mb = None
+        for process in process_tree(self._driver):
+            # Prime cpu_percent so the next sample covers the interval since now.
+            self._processes[process.pid] = process
+            _safe(process.cpu_percent)
+
+    def _sample(self):
+        if psutil is None:
+            return None, None
+        rss_bytes, cpu_percent, found = 0, 0.0, False
+        for process in process_tree(self._driver):
+            process = self._processes.setdefault(process.pid, process)
+            memory = _safe(process.memory_info)
+            if memory is None:
+                continue
+            found = True
+            rss_bytes += memory.rss
+            cpu_percent += _safe(process.cpu_percent) or 0.0
+        if not found:
+            return None, None
+        return rss_bytes / (1024 * 1024), cpu_percent
+
+    def _kill(self):
+        driver, self._driver = self._driver, None
+        if self.hygiene is not None:
+            self.hygiene.detach()
+        processes = process_tree(driver)
+        if self._start_rss_mb is not None and self._last_rss_mb is not None:
+            self.metrics["rss_growth_mb"].append(self._last_rss_mb - self._start_rss_mb)
+        quitter = threading.Thread(target=_safe, args=(driver.quit,), daemon=True)
+        quitter.start()
+        quitter.join(self.ping_timeout)
+        for process in processes:
+            if _safe(process.is_running):
+                _safe(process.kill)
+
+
+def ping(driver, timeout):
+    """
+    Run a trivial command against the session in a background thread.
+
+    :param driver: WebDriver instance.
+    :param timeout: Seconds to wait for the answer.
+    :return: None when the session answered, otherwise a short reason.
+    """
+    result = {}
+
+    def target():
+        try:
+            driver.execute_script("return 1;")
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return f"hung (no answer after {time.perf_counter() - started:.1f}s)"
+    if "error" in result:
+        return f"crashed ({type(result['error']).__name__}: {result['error']})"
+    return None
+
+
+def process_tree(driver):
+    """
+    Return the driver service process and all its descendants (the browser processes)
+    for drivers started locally. Remote sessions have no local processes.
+
+    :param driver: WebDriver instance.
+    :return: List of psutil.Process objects.
+    """
+    if psutil is None:
+        return []
+    pid = getattr(getattr(getattr(driver, "service", None), "process", None), "pid", None)
+    if not isinstance(pid, int):
+        return []
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def _safe(method, *args):
+    try:
+        return method(*args)
+    except Exception:
+        return None
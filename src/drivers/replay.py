@@ -0,0 +1,211 @@
+import gzip
+import json
+import threading
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import wait as selenium_wait
+from src.utils.logger import get_logger
+
+# Read-only commands issued by waits and polling loops. Only these may be repeated more or
+# fewer times during replay than during recording; any other command must match one-to-one.
+POLLING_COMMANDS = {
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+    "isElementDisplayed", Command.IS_ELEMENT_ENABLED,
+    Command.W3C_EXECUTE_SCRIPT, Command.GET_TITLE,  # is_displayed() runs as a script in W3C mode
+}
+
+
+class ReplayMismatchError(AssertionError):
+    """
+    Raised when a replayed driver issues a command the recording does not contain at that point.
+    """
+
+
+class CommandRecorder:
+    """
+    CommandRecorder wraps the command executor of a live driver and appends every
+    WebDriver command, its parameters and the raw response to a compact JSON lines
+    file (gzip-compressed when the path ends with '.gz').
+
+    Example usage:
+        driver = DriverFactory.get_driver("web")
+        record_commands(driver, "tests/recordings/login.jsonl.gz")
+        LoginPage(driver).login("alice", "secret")
+        driver.quit()   # closes the recording
+    """
+
+    def __init__(self, executor, path):
+        """
+        :param executor: The command executor (RemoteConnection) of the live driver.
+        :param path: Output file path.
+        """
+        self._executor = executor
+        self.path = path
+        self._file = _open(path, "wt")
+        self.commands = 0
+
+    def execute(self, command, params):
+        response = self._executor.execute(command, params)
+        self.write(command, params, response)
+        return response
+
+    def write(self, command, params, response):
+        """
+        Append one command and response. The response is serialized before the driver
+        unwraps it in place.
+        """
+        self._file.write(json.dumps([command, _strip_session(params), response], separators=(",", ":")))
+        self._file.write("\n")
+        self.commands += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            get_logger(self.__class__.__name__).info(f"Recorded {self.commands} commands to {self.path}")
+        self._executor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+
+class _ReplayClock:
+    """
+    Stand-in for the `time` module used by WebDriverWait. A sleep that directly follows
+    a replayed command advances a per-thread virtual clock instead of sleeping, so that
+    waits on a ReplayDriver, including recorded retries and timeouts, take no real time.
+    Waits on live drivers keep sleeping in real time.
+
+    WebDriverWait.until() reads the clock once between polling and sleeping; a replayed
+    command followed by more than one read belongs to an earlier wait, not this one.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def replayed(self):
+        self._local.replayed_at = getattr(self._local, "reads", 0)
+
+    def monotonic(self):
+        self._local.reads = getattr(self._local, "reads", 0) + 1
+        return self._real.monotonic() + getattr(self._local, "offset", 0.0)
+
+    def sleep(self, seconds):
+        if getattr(self._local, "replayed_at", None) == getattr(self._local, "reads", 0) - 1:
+            self._local.replayed_at = None
+            self._local.offset = getattr(self._local, "offset", 0.0) + seconds
+        else:
+            self._real.sleep(seconds)
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+def _replay_clock():
+    if not isinstance(selenium_wait.time, _ReplayClock):
+        selenium_wait.time = _ReplayClock(selenium_wait.time)
+    return selenium_wait.time
+
+
+class ReplayExecutor:
+    """
+    ReplayExecutor serves recorded responses in order, checking that each command and its
+    parameters match the recording. POLLING_COMMANDS repeated more or fewer times than
+    during recording (e.g. by WebDriverWait) are tolerated; a repeated click or keystroke
+    is a mismatch. Waits between replayed polls run on a virtual clock (see _ReplayClock).
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Recording produced by CommandRecorder.
+        :raises FileNotFoundError: If the recording does not exist.
+        """
+        self.path = path
+        self._entries = []
+        with _open(path, "rt") as f:
+            for line in f:
+                command, params, response = json.loads(line)
+                self._entries.append((_key(command, params), json.dumps(response), command in POLLING_COMMANDS))
+        self._position = 0
+        self._last = None
+        self._clock = _replay_clock()
+
+    def execute(self, command, params):
+        self._clock.replayed()
+        key = _key(command, params)
+        while self._position < len(self._entries):
+            entry = self._entries[self._position]
+            if entry[0] == key:
+                self._position += 1
+                self._last = entry
+                return json.loads(entry[1])
+            if self._last is not None and self._last[2] and entry[0] == self._last[0]:
+                # The recording polled this command more often than the replay does.
+                self._position += 1
+                continue
+            break
+        if self._last is not None and self._last[2] and self._last[0] == key:
+            # The replay polls more often than the recording did.
+            return json.loads(self._last[1])
+        expected = self._entries[self._position][0] if self._position < len(self._entries) else "end of recording"
+        raise ReplayMismatchError(
+            f"Command {key} does not match the recording {self.path} at entry {self._position}: expected {expected}"
+        )
+
+    def close(self):
+        pass
+
+
+class ReplayDriver(WebDriver):
+    """
+    ReplayDriver is a regular Selenium WebDriver whose commands are answered from a
+    recording instead of a browser, so page objects can be exercised deterministically
+    in unit tests without any browser.
+
+    Example usage:
+        driver = ReplayDriver("tests/recordings/login.jsonl.gz")
+        assert LoginPage(driver).login("alice", "secret").get_title() == "Dashboard"
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Recording produced by CommandRecorder.
+        """
+        super().__init__(command_executor=ReplayExecutor(path), options=ArgOptions())
+
+
+def record_commands(driver, path):
+    """
+    Start recording the commands of a live driver. The session creation is written first
+    so that a ReplayDriver can start from the recording.
+
+    :param driver: Selenium WebDriver instance.
+    :param path: Output file path.
+    :return: The CommandRecorder now used as the driver's command executor.
+    """
+    recorder = CommandRecorder(driver.command_executor, path)
+    recorder.write(Command.NEW_SESSION, None, {
+        "value": {"sessionId": driver.session_id, "capabilities": driver.capabilities},
+    })
+    driver.command_executor = recorder
+    return recorder
+
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _strip_session(params):
+    if not params or "sessionId" not in params:
+        return params
+    return {name: value for name, value in params.items() if name != "sessionId"}
+
+
+def _key(command, params):
+    if command == Command.NEW_SESSION:
+        return command
+    return command + json.dumps(_strip_session(params), sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,166 @@
+from src.config.config import CONFIG
+from src.utils.logger import get_logger
+
+# BasePage actions that load a new document in the browser.
+NAVIGATION_ACTIONS = {"navigate_to", "refresh_page"}
+
+# Clears what the browser keeps between documents of the current origin.
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+return window.location.origin;
+"""
+
+_active_hygiene = None
+
+
+class HygienePolicy:
+    """
+    Limits applied to a long-lived driver session between tests. A value of 0 disables the rule.
+    """
+
+    def __init__(self, restart_after_navigations=0, restart_above_rss_mb=0, close_tabs_every=0,
+                 clear_storage_every=0):
+        """
+        :param restart_after_navigations: Restart the session after this many navigations.
+        :param restart_above_rss_mb: Restart the session when driver and browser RSS exceed this many MB.
+        :param close_tabs_every: Close every window but the first one every N tests.
+        :param clear_storage_every: Clear cache, cookies and storage every N tests.
+        """
+        self.restart_after_navigations = restart_after_navigations
+        self.restart_above_rss_mb = restart_above_rss_mb
+        self.close_tabs_every = close_tabs_every
+        self.clear_storage_every = clear_storage_every
+
+    @classmethod
+    def from_config(cls):
+        """
+        Build the policy from the HYGIENE_* entries of CONFIG.
+        """
+        return cls(
+            restart_after_navigations=CONFIG.get("HYGIENE_RESTART_AFTER_NAVIGATIONS", 0),
+            restart_above_rss_mb=CONFIG.get("HYGIENE_RESTART_ABOVE_RSS_MB", 0),
+            close_tabs_every=CONFIG.get("HYGIENE_CLOSE_TABS_EVERY", 0),
+            clear_storage_every=CONFIG.get("HYGIENE_CLEAR_STORAGE_EVERY", 0),
+        )
+
+    def __repr__(self):
+        return (f"HygienePolicy(restart_after_navigations={self.restart_after_navigations}, "
+                f"restart_above_rss_mb={self.restart_above_rss_mb}, close_tabs_every={self.close_tabs_every}, "
+                f"clear_storage_every={self.clear_storage_every})")
+
+
+class SessionHygiene:
+    """
+    SessionHygiene applies a HygienePolicy to the driver owned by a DriverWatchdog.
+    The watchdog calls apply() after each successful health check, i.e. between tests.
+    Navigations are counted through BasePage while the hygiene is active.
+
+    Example usage:
+        hygiene = SessionHygiene(HygienePolicy(restart_after_navigations=200, clear_storage_every=10))
+        watchdog = DriverWatchdog(lambda: DriverFactory.get_driver("web"), hygiene=hygiene)
+    """
+
+    def __init__(self, policy):
+        """
+        :param policy: HygienePolicy instance.
+        """
+        self.policy = policy
+        self.driver = None
+        self.navigations = 0
+        self.tests = 0
+        self.metrics = {"tabs_closed": 0, "storage_clears": 0}
+        self.logger = get_logger(self.__class__.__name__)
+
+    def attach(self, driver):
+        """
+        Start tracking a freshly started driver and make this hygiene the active one.
+
+        :param driver: The new driver instance.
+        """
+        global _active_hygiene
+        self.driver = driver
+        self.navigations = 0
+        _active_hygiene = self
+
+    def detach(self):
+        """
+        Stop tracking the current driver.
+        """
+        global _active_hygiene
+        self.driver = None
+        if _active_hygiene is self:
+            _active_hygiene = None
+
+    def record_navigation(self, driver):
+        """
+        Count a navigation performed through BasePage on the tracked driver.
+
+        :param driver: Driver used for the navigation.
+        """
+        if driver is self.driver:
+            self.navigations += 1
+
+    def apply(self, watchdog):
+        """
+        Apply the policy between two tests.
+
+        :param watchdog: DriverWatchdog owning the session.
+        """
+        self.tests += 1
+        policy = self.policy
+        if policy.restart_after_navigations and self.navigations >= policy.restart_after_navigations:
+            watchdog.restart(f"{self.navigations} navigations reached limit {policy.restart_after_navigations}")
+            return
+        if policy.close_tabs_every and self.tests % policy.close_tabs_every == 0:
+            self.metrics["tabs_closed"] += close_extra_tabs(self.driver)
+        if policy.clear_storage_every and self.tests % policy.clear_storage_every == 0:
+            clear_browser_storage(self.driver)
+            self.metrics["storage_clears"] += 1
+
+
+def close_extra_tabs(driver):
+    """
+    Close every window except the first one and switch back to it.
+
+    :param driver: WebDriver instance.
+    :return: Number of windows closed.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    if handles:
+        driver.switch_to.window(handles[0])
+    return max(len(handles) - 1, 0)
+
+
+def clear_browser_storage(driver):
+    """
+    Clear the HTTP cache, cookies and web storage of the browser.
+    Chromium browsers are cleared through CDP; others fall back to cookies and script.
+
+    :param driver: WebDriver instance.
+    """
+    origin = None
+    try:
+        origin = driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    except Exception as e:
+        get_logger("SessionHygiene").warning(f"Could not clear web storage: {e}")
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            if origin and origin.startswith("http"):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            return
+        except Exception as e:
+            get_logger("SessionHygiene").warning(f"CDP cleanup failed, falling back to cookies: {e}")
+    driver.delete_all_cookies()
+
+
+def current_hygiene():
+    """
+    Return the active SessionHygiene, or None when no policy is applied.
+    """
+    return _active_hygiene
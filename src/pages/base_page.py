@@ -1,8 +1,14 @@
 import time
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from src.utils.logger import get_logger  # Assuming a logger utility is implemented
+from src.utils.artifacts import current_collector
+from src.utils.run_events import current_stream
+from src.utils.locator_analyzer import current_analyzer
+from src.pages.element import Element, PREFETCH_SCRIPT
+from src.drivers.session_hygiene import NAVIGATION_ACTIONS, current_hygiene
+from src.utils.impact import current_tracker
 
 
 class BasePage:
@@ -12,13 +18,122 @@ class BasePage:
     taking screenshots, and other frequent web operations.
     """
 
+    # Element descriptors declared on the class and its bases, compiled at class creation.
+    _elements = {}
+    _prefetch_specs = []
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect the Element descriptors of a subclass once, so that instances only
+        look them up instead of scanning the class on every call.
+        """
+        super().__init_subclass__(**kwargs)
+        elements = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Element):
+                    elements[name] = value
+                elif name in elements:
+                    # A base class element overridden by a non-element attribute.
+                    del elements[name]
+        cls._elements = elements
+        cls._prefetch_specs = [[element[0], element[1], element.many] for element in elements.values()]
+
     def __init__(self, driver, timeout=10):
         """
         Initialize with a Selenium WebDriver instance and an optional default timeout.
         """
         self.driver = driver
         self.timeout = timeout
+        self._element_cache = {}
+        self._document = None
         self.logger = get_logger(self.__class__.__name__)
+        collector = current_collector()
+        if collector is not None:
+            collector.attach_driver(driver)
+        tracker = current_tracker()
+        if tracker is not None:
+            tracker.record_page(self.__class__)
+
+    def _record(self, action, locator, started, detail=None):
+        """
+        Report a finished action to the active artifact collector, event stream,
+        locator analyzer, session hygiene and impact tracker, if any.
+
+        :param action: Name of the action.
+        :param locator: Tuple (By.<METHOD>, "value") or None
+        :param started: time.perf_counter() value taken when the action started
+        :param detail: Optional short detail (e.g. 'timeout')
+        """
+        duration = time.perf_counter() - started
+        collector = current_collector()
+        if collector is not None:
+            collector.record_action(action, locator, duration, detail)
+        stream = current_stream()
+        if stream is not None:
+            stream.action(action, locator, duration, detail)
+        analyzer = current_analyzer()
+        if analyzer is not None and locator is not None:
+            analyzer.record(self, action, locator, duration, detail)
+        tracker = current_tracker()
+        if tracker is not None and locator is not None:
+            tracker.record_locator(locator)
+        if action in NAVIGATION_ACTIONS:
+            hygiene = current_hygiene()
+            if hygiene is not None:
+                hygiene.record_navigation(self.driver)
+
+    def prefetch_elements(self):
+        """
+        Resolve every Element declared on the page in a single script call and cache them.
+        Single elements that are not present yet are left to be resolved lazily on first
+        access; many-elements without a match are cached as empty lists.
+
+        :return: Number of elements cached.
+        """
+        if not self._prefetch_specs:
+            return 0
+        started = time.perf_counter()
+        results = self.driver.execute_script(PREFETCH_SCRIPT, self._prefetch_specs) or {}
+        self._document = results.get("document")
+        cached = 0
+        for name, result in zip(self._elements, results.get("elements") or []):
+            if result is not None:
+                self._element_cache[name] = result
+                cached += 1
+        self._record("prefetch_elements", None, started, f"{cached}/{len(self._elements)}")
+        self.logger.info(f"Prefetched {cached} of {len(self._elements)} declared elements")
+        return cached
+
+    def invalidate_elements(self):
+        """
+        Drop every cached Element so the next access resolves it again.
+        Called automatically on navigation and refresh.
+        """
+        self._element_cache.clear()
+        self._document = None
+
+    def _is_stale(self, cached):
+        """
+        Check a cached Element result with one command to the driver. An empty list is
+        checked through the document element it was resolved in. A stale result drops
+        the whole cache, since the page it belonged to is gone.
+
+        :param cached: WebElement or list of WebElements
+        :return: True if the result must be resolved again.
+        """
+        if isinstance(cached, list):
+            probe = cached[0] if cached else self._document
+        else:
+            probe = cached
+        if probe is not None:
+            try:
+                probe.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                pass
+        self.invalidate_elements()
+        return True
 
     def find_element(self, locator, timeout=None):
         """
@@ -29,13 +144,16 @@ class BasePage:
         :return: WebElement
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
             )
+            self._record("find_element", locator, started)
             self.logger.info(f"Element found: {locator}")
             return element
         except TimeoutException as te:
+            self._record("find_element", locator, started, "timeout")
             self.logger.error(f"Timeout waiting for element: {locator}")
             raise te
 
@@ -48,13 +166,16 @@ class BasePage:
         :return: List of WebElements
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         try:
             elements = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_all_elements_located(locator)
             )
+            self._record("find_elements", locator, started)
             self.logger.info(f"Found {len(elements)} elements: {locator}")
             return elements
         except TimeoutException as te:
+            self._record("find_elements", locator, started, "timeout")
             self.logger.error(f"Timeout waiting for elements: {locator}")
             raise te
 
@@ -66,13 +187,22 @@ class BasePage:
         :param timeout: Optional custom timeout
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
+            analyzer = current_analyzer()
+            if analyzer is not None:
+                # Inspect the DOM before the click can replace it; not counted in the click time.
+                inspected = time.perf_counter()
+                analyzer.inspect(self, locator)
+                started += time.perf_counter() - inspected
             element.click()
+            self._record("click", locator, started)
             self.logger.info(f"Clicked element: {locator}")
         except TimeoutException as te:
+            self._record("click", locator, started, "timeout")
             self.logger.error(f"Timeout waiting to click element: {locator}")
             raise te
 
@@ -85,9 +215,11 @@ class BasePage:
         :param timeout: Optional custom timeout
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         element = self.find_element(locator, timeout)
         element.clear()
         element.send_keys(text)
+        self._record("enter_text", locator, started)
         self.logger.info(f"Entered text into element {locator}: '{text}'")
 
     def get_text(self, locator, timeout=None):
@@ -112,13 +244,16 @@ class BasePage:
         :return: True if visible, False otherwise
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
+            self._record("is_element_displayed", locator, started)
             self.logger.info(f"Element is visible: {locator}")
             return True
         except TimeoutException:
+            self._record("is_element_displayed", locator, started, "not visible")
             self.logger.warning(f"Element is not visible: {locator}")
             return False
 
@@ -131,19 +266,23 @@ class BasePage:
         :return: True if the element disappears, raises TimeoutException otherwise
         """
         timeout = timeout or self.timeout
+        started = time.perf_counter()
         try:
             result = WebDriverWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located(locator)
             )
+            self._record("wait_for_element_to_disappear", locator, started)
             self.logger.info(f"Element disappeared: {locator}")
             return result
         except TimeoutException as te:
+            self._record("wait_for_element_to_disappear", locator, started, "timeout")
             self.logger.error(f"Element did not disappear: {locator}")
             raise te
 
     def take_screenshot(self, file_name=None):
         """
-        Take a screenshot of the current window and save it.
+        Take a screenshot of the current window and save it. The screenshot is
+        attached to the current test in the event stream, if any.
 
         :param file_name: Optional file name; if not provided, a timestamp-based name is generated.
         :return: The path to the screenshot file.
@@ -153,6 +292,9 @@ class BasePage:
         screenshot_path = f"reports/screenshots/{file_name}"
         self.driver.save_screenshot(screenshot_path)
         self.logger.info(f"Screenshot saved: {screenshot_path}")
+        stream = current_stream()
+        if stream is not None and stream.test is not None:
+            stream.artifact(stream.test, "screenshot", screenshot_path)
         return screenshot_path
 
     def scroll_to_element(self, locator, timeout=None):
@@ -180,7 +322,10 @@ class BasePage:
         """
         Refresh the current page.
         """
+        started = time.perf_counter()
+        self.invalidate_elements()
         self.driver.refresh()
+        self._record("refresh_page", None, started)
         self.logger.info("Page refreshed.")
 
     def navigate_to(self, url):
@@ -189,5 +334,8 @@ class BasePage:
 
         :param url: The target URL.
         """
+        started = time.perf_counter()
+        self.invalidate_elements()
         self.driver.get(url)
+        self._record("navigate_to", None, started, url)
         self.logger.info(f"Navigated to URL: {url}")
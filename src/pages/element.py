@@ -0,0 +1,109 @@
+from selenium.webdriver.common.by import By
+
+# Locator strategies accepted by Selenium's find_element.
+SUPPORTED_STRATEGIES = {
+    By.ID, By.NAME, By.XPATH, By.CSS_SELECTOR, By.CLASS_NAME,
+    By.TAG_NAME, By.LINK_TEXT, By.PARTIAL_LINK_TEXT,
+}
+
+# Resolves a list of [by, value, many] specs in a single round trip. Each result is
+# a WebElement (or null) for single elements and a list of WebElements otherwise.
+# The document element is returned along with them to detect when the page changes.
+PREFETCH_SCRIPT = """
+var specs = arguments[0];
+var results = [];
+function esc(value) {
+    return (window.CSS && CSS.escape) ? CSS.escape(value) : value.replace(/([^\\w-])/g, '\\\\$1');
+}
+function quote(value) { return '"' + value.replace(/(["\\\\])/g, '\\\\$1') + '"'; }
+function byLinkText(value, partial) {
+    return Array.prototype.filter.call(document.getElementsByTagName('a'), function (a) {
+        var text = (a.innerText || a.textContent || '').trim();
+        return partial ? text.indexOf(value) !== -1 : text === value;
+    });
+}
+function resolve(by, value) {
+    switch (by) {
+        case 'id': return document.querySelectorAll('[id=' + quote(value) + ']');
+        case 'name': return document.querySelectorAll('[name=' + quote(value) + ']');
+        case 'class name': return document.querySelectorAll('.' + esc(value));
+        case 'css selector':
+        case 'tag name': return document.querySelectorAll(value);
+        case 'link text': return byLinkText(value, false);
+        case 'partial link text': return byLinkText(value, true);
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+    }
+    return [];
+}
+for (var i = 0; i < specs.length; i++) {
+    var found;
+    try { found = Array.prototype.slice.call(resolve(specs[i][0], specs[i][1])); } catch (e) { found = []; }
+    results.push(specs[i][2] ? found : (found.length ? found[0] : null));
+}
+return {elements: results, document: document.documentElement};
+"""
+
+
+class Element(tuple):
+    """
+    Element is a declarative locator for BasePage subclasses.
+
+    On the class it behaves like a plain (By.<METHOD>, "value") tuple, so it can be passed
+    to every BasePage method. On an instance it resolves lazily to the WebElement (or the
+    list of WebElements when many=True) and caches the result. A cached result is checked
+    on every access and the cache is dropped once it went stale, e.g. after a click that
+    submitted a form or a navigation through another page object on the same driver.
+
+    Example usage:
+        class LoginPage(BasePage):
+            username = Element(By.ID, "user")
+            rows = Element(By.CSS_SELECTOR, "table tr", many=True)
+
+        page = LoginPage(driver)
+        page.prefetch_elements()
+        page.username.send_keys("alice")
+        page.click(LoginPage.username)
+    """
+
+    def __new__(cls, by, value, many=False):
+        """
+        Create and validate the descriptor.
+
+        :param by: Locator strategy (By.<METHOD>)
+        :param value: Locator value
+        :param many: Resolve to a list of all matching elements instead of the first one
+        :raises ValueError: If the strategy is unknown or the value is empty.
+        """
+        if by not in SUPPORTED_STRATEGIES:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"Locator value must be a non-empty string, got {value!r}")
+        element = super().__new__(cls, (by, value))
+        element.many = many
+        element.name = None
+        return element
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        cache = page._element_cache
+        if self.name in cache and not page._is_stale(cache[self.name]):
+            return cache[self.name]
+        if self.many:
+            cache[self.name] = page.find_elements(self)
+        else:
+            cache[self.name] = page.find_element(self)
+        return cache[self.name]
+
+    def __repr__(self):
+        return f"Element({self[0]!r}, {self[1]!r}{', many=True' if self.many else ''})"
+
+    def __reduce__(self):
+        return (Element, (self[0], self[1], self.many))
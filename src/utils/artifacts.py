@@ -0,0 +1,189 @@
+import collections
+import logging
+import os
+import re
+import time
+from src.utils.logger import get_logger
+
+# Number of recent events kept in memory for each test.
+DEFAULT_BUFFER_SIZE = 200
+
+# Root directory for per-test failure artifacts.
+ARTIFACT_ROOT = os.path.join("reports", "artifacts")
+
+_active_collector = None
+_log_handler = None
+
+
+class ArtifactCollector:
+    """
+    ArtifactCollector keeps a bounded, in-memory ring buffer of the recent
+    actions and log records of a single test. Nothing touches the disk until
+    flush() is called, which is expected to happen only when the test fails.
+
+    Example usage:
+        collector = start_capture("tests/test_login.py::test_valid_user")
+        collector.record_action("click", ("id", "submit"), 0.12)
+        if failed:
+            collector.flush()
+        stop_capture()
+    """
+
+    def __init__(self, test_id, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Initialize the collector for a test.
+
+        :param test_id: Identifier of the test (usually the pytest node id).
+        :param buffer_size: Maximum number of events retained in memory.
+        """
+        self.test_id = test_id
+        self.events = collections.deque(maxlen=buffer_size)
+        self.actions = 0
+        self.drivers = []
+        self.flushed_to = None
+        self.logger = get_logger(self.__class__.__name__)
+
+    def record_action(self, action, locator=None, duration=None, detail=None):
+        """
+        Append a page action to the ring buffer.
+
+        :param action: Name of the action (e.g. 'click', 'find_element').
+        :param locator: Optional tuple (By.<METHOD>, "value") the action used.
+        :param duration: Optional time spent in the action, in seconds.
+        :param detail: Optional short free-form detail (e.g. 'timeout').
+        """
+        self.events.append(("action", time.time(), action, locator, duration, detail))
+        self.actions += 1
+
+    def record_log(self, record):
+        """
+        Append a logging record to the ring buffer. Formatting is deferred until flush.
+
+        :param record: logging.LogRecord instance.
+        """
+        self.events.append(("log", record.created, record))
+
+    def attach_driver(self, driver):
+        """
+        Remember a driver used by the test so it can be inspected on failure.
+
+        :param driver: Selenium WebDriver instance.
+        """
+        if not any(known is driver for known in self.drivers):
+            self.drivers.append(driver)
+
+    def flush(self, root=ARTIFACT_ROOT):
+        """
+        Write the buffered events, screenshots, page sources and browser console
+        logs of every attached driver to a per-test artifact directory.
+
+        :param root: Directory under which the per-test directory is created.
+        :return: The path to the per-test artifact directory.
+        """
+        if self.flushed_to:
+            return self.flushed_to
+
+        artifact_dir = os.path.join(root, _safe_name(self.test_id))
+        os.makedirs(artifact_dir, exist_ok=True)
+        # Snapshot the buffer first, since logging below appends to it.
+        events = list(self.events)
+
+        with open(os.path.join(artifact_dir, "timeline.log"), "w", encoding="utf-8") as timeline:
+            for event in events:
+                timeline.write(_format_event(event) + "\n")
+
+        for index, driver in enumerate(self.drivers):
+            suffix = f"_{index}" if index else ""
+            self._capture(driver, "save_screenshot", os.path.join(artifact_dir, f"screenshot{suffix}.png"))
+            self._write(driver, "page_source", os.path.join(artifact_dir, f"page_source{suffix}.html"))
+            self._write(driver, "browser_log", os.path.join(artifact_dir, f"console{suffix}.log"))
+
+        self.flushed_to = artifact_dir
+        self.logger.info(f"Failure artifacts for {self.test_id} saved to {artifact_dir}")
+        return artifact_dir
+
+    def _capture(self, driver, method, path):
+        try:
+            getattr(driver, method)(path)
+        except Exception as e:
+            self.logger.warning(f"Could not capture {os.path.basename(path)}: {e}")
+
+    def _write(self, driver, source, path):
+        try:
+            if source == "page_source":
+                content = driver.page_source
+            else:
+                entries = driver.get_log("browser")
+                content = "\n".join(
+                    f"{entry.get('timestamp')} {entry.get('level')} {entry.get('message')}" for entry in entries
+                )
+            with open(path, "w", encoding="utf-8") as output:
+                output.write(str(content))
+        except Exception as e:
+            self.logger.warning(f"Could not capture {os.path.basename(path)}: {e}")
+
+
+class _BufferHandler(logging.Handler):
+    """
+    Logging handler that forwards records to the active collector, if any.
+    """
+
+    def emit(self, record):
+        collector = _active_collector
+        if collector is not None:
+            collector.record_log(record)
+
+
+def start_capture(test_id, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Start capturing events for a test and make its collector the active one.
+
+    :param test_id: Identifier of the test.
+    :param buffer_size: Maximum number of events retained in memory.
+    :return: The new ArtifactCollector.
+    """
+    global _active_collector, _log_handler
+    if _log_handler is None:
+        _log_handler = _BufferHandler(level=logging.DEBUG)
+        logging.getLogger().addHandler(_log_handler)
+    _active_collector = ArtifactCollector(test_id, buffer_size)
+    return _active_collector
+
+
+def stop_capture():
+    """
+    Stop capturing and discard the active collector.
+    """
+    global _active_collector
+    _active_collector = None
+
+
+def current_collector():
+    """
+    Return the active ArtifactCollector, or None when no test is being captured.
+    """
+    return _active_collector
+
+
+def _safe_name(test_id):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id).strip("_") or "unnamed"
+
+
+def _format_event(event):
+    timestamp = time.strftime("%H:%M:%S", time.localtime(event[1])) + f".{int(event[1] * 1000) % 1000:03d}"
+    if event[0] == "action":
+        _, _, action, locator, duration, detail = event
+        line = f"{timestamp} ACTION {action}"
+        if locator is not None:
+            line += f" {locator}"
+        if duration is not None:
+            line += f" ({duration * 1000:.1f} ms)"
+        if detail:
+            line += f" [{detail}]"
+        return line
+    record = event[2]
+    try:
+        message = record.getMessage()
+    except Exception:
+        message = str(record.msg)
+    return f"{timestamp} {record.levelname} {record.name} - {message}"
@@ -1,6 +1,7 @@
 import os
 from openpyxl import load_workbook
 from src.utils.logger import get_logger
+from src.utils.impact import current_tracker
 
 
 class ExcelReader:
@@ -56,6 +57,7 @@ class ExcelReader:
             self.logger.error(f"Sheet '{sheet_name}' not found in {self.file_path}")
             raise ValueError(f"Sheet '{sheet_name}' not found in the workbook")
 
+        self._track(sheet_name)
         sheet = self.workbook[sheet_name]
         data = []
         rows = list(sheet.rows)
@@ -90,6 +92,7 @@ class ExcelReader:
             self.logger.error(f"Sheet '{sheet_name}' not found in {self.file_path}")
             raise ValueError(f"Sheet '{sheet_name}' not found in the workbook")
 
+        self._track(sheet_name)
         sheet = self.workbook[sheet_name]
         # Handle column as either an integer index or a letter
         if isinstance(column, int):
@@ -100,3 +103,11 @@ class ExcelReader:
         cell_value = cell.value
         self.logger.info(f"Value at {sheet_name} (row {row}, column {column}): {cell_value}")
         return cell_value
+
+    def _track(self, sheet_name):
+        """
+        Report a sheet read to the active impact tracker, if any.
+        """
+        tracker = current_tracker()
+        if tracker is not None:
+            tracker.record_sheet(self.file_path, sheet_name)
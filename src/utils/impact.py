@@ -0,0 +1,305 @@
+import inspect
+import io
+import json
+import os
+import subprocess
+from src.utils.logger import get_logger
+
+# Default location of the dependency index.
+INDEX_PATH = os.path.join("reports", "impact", "index.json")
+
+WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm")
+
+# Documentation files, which cannot affect any test.
+DOCUMENTATION_EXTENSIONS = (".md", ".rst")
+
+# Framework modules every page object depends on, including at class creation. Only
+# instantiation is recorded, so a change to them can affect any test and selects every test.
+SHARED_PAGE_FILES = {"src/pages/base_page.py", "src/pages/element.py"}
+
+_active_tracker = None
+
+
+class ImpactTracker:
+    """
+    ImpactTracker records, per test, the BasePage subclasses (and the files defining them),
+    the locators and the Excel sheets a test exercised.
+
+    Example usage:
+        tracker = enable_tracking()
+        tracker.start_test("tests/test_login.py::test_valid_user")
+        ...  # run the test
+        tracker.stop_test()
+        index.update(tracker.records)
+    """
+
+    def __init__(self, root=None):
+        """
+        :param root: Project root; recorded file paths are relative to it.
+        """
+        self.root = os.path.abspath(root or os.getcwd())
+        self.records = {}
+        self._current = None
+        self._class_files = {}
+
+    def start_test(self, nodeid):
+        """
+        Start recording the dependencies of a test.
+
+        :param nodeid: The pytest node id.
+        """
+        self._current = self.records[nodeid] = {"pages": set(), "files": set(), "locators": set(), "sheets": {}}
+
+    def stop_test(self):
+        self._current = None
+
+    def record_page(self, page_class):
+        """
+        Record a page class and the source files of its page-object hierarchy.
+
+        :param page_class: Class of the page object instance.
+        """
+        if self._current is None:
+            return
+        self._current["pages"].add(f"{page_class.__module__}.{page_class.__qualname__}")
+        self._current["files"].update(self._files_of(page_class))
+
+    def record_locator(self, locator):
+        """
+        :param locator: Tuple (By.<METHOD>, "value")
+        """
+        if self._current is not None:
+            self._current["locators"].add(f"{locator[0]}={locator[1]}")
+
+    def record_sheet(self, file_path, sheet_name):
+        """
+        Workbooks outside the project root (e.g. temporary files) are not recorded.
+
+        :param file_path: Path of the workbook read through ExcelReader.
+        :param sheet_name: Name of the sheet read.
+        """
+        if self._current is None:
+            return
+        relative = self._relative(file_path)
+        if not relative.startswith(".."):
+            self._current["sheets"].setdefault(relative, set()).add(sheet_name)
+
+    def _files_of(self, page_class):
+        files = self._class_files.get(page_class)
+        if files is None:
+            files = set()
+            for klass in page_class.__mro__:
+                try:
+                    source = inspect.getsourcefile(klass)
+                except TypeError:
+                    continue
+                if source:
+                    relative = self._relative(source)
+                    if not relative.startswith(".."):
+                        files.add(relative)
+            self._class_files[page_class] = files
+        return files
+
+    def _relative(self, path):
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+
+
+class DependencyIndex:
+    """
+    DependencyIndex stores the dependencies recorded for each test as JSON and maps
+    changed files and workbooks to the tests they affect.
+    """
+
+    def __init__(self, tests=None):
+        """
+        :param tests: Mapping of node id to its dependency record.
+        """
+        self.tests = tests or {}
+        self.logger = get_logger(self.__class__.__name__)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """
+        Load an index from disk; a missing file gives an empty index.
+        """
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f).get("tests", {}))
+
+    def save(self, path=INDEX_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tests": self.tests}, f, indent=1, sort_keys=True)
+
+    def update(self, records):
+        """
+        Replace the entries of the tests that ran with their new records. Entries of tests
+        that did not run are kept, so the index grows incrementally across runs.
+
+        :param records: ImpactTracker.records
+        """
+        for nodeid, record in records.items():
+            self.tests[nodeid] = {
+                "pages": sorted(record["pages"]),
+                "files": sorted(record["files"]),
+                "locators": sorted(record["locators"]),
+                "sheets": {path: sorted(sheets) for path, sheets in sorted(record["sheets"].items())},
+            }
+
+    def prune(self, collected, root=None, narrowed=()):
+        """
+        Drop the entries of tests that no longer exist: tests whose module was removed,
+        and tests missing from a module that was collected in full.
+
+        :param collected: Node ids collected in this run, before any deselection.
+        :param root: Project root the node ids are relative to.
+        :param narrowed: Modules whose collection was narrowed to some node ids
+                         (e.g. 'tests/test_x.py::test_y' on the command line).
+        :return: Number of entries removed.
+        """
+        collected = set(collected)
+        collected_files = {nodeid.split("::")[0] for nodeid in collected} - set(narrowed)
+        root = root or os.getcwd()
+        stale = [
+            nodeid for nodeid in self.tests
+            if nodeid not in collected and (nodeid.split("::")[0] in collected_files
+                                            or not os.path.exists(os.path.join(root, nodeid.split("::")[0])))
+        ]
+        for nodeid in stale:
+            del self.tests[nodeid]
+        return len(stale)
+
+    def affected(self, changed_files, changed_sheets=None, nodeids=None):
+        """
+        Select the tests affected by a change.
+
+        - A changed page-object module selects the tests that used a class defined in it,
+          except SHARED_PAGE_FILES, which select every test.
+        - A changed workbook selects the tests that read one of its changed sheets
+          (all of its sheets when changed_sheets has no entry for it).
+        - A changed test module selects its own tests.
+        - A changed documentation file selects nothing.
+        - Any other changed file (Python module, fixture, requirements, ...) may affect
+          anything and selects every test.
+        - Tests missing from the index are always selected.
+
+        :param changed_files: Paths relative to the project root.
+        :param changed_sheets: Optional mapping of workbook path to the set of changed sheets.
+        :param nodeids: Collected node ids; defaults to the tests in the index.
+        :return: Set of selected node ids.
+        """
+        nodeids = list(self.tests) if nodeids is None else list(nodeids)
+        changed_sheets = changed_sheets or {}
+        page_files = {path for record in self.tests.values() for path in record["files"]}
+        test_files = {nodeid.split("::")[0] for nodeid in nodeids}
+        selected = {nodeid for nodeid in nodeids if nodeid not in self.tests}
+
+        for path in changed_files:
+            if path in SHARED_PAGE_FILES:
+                self.logger.info(f"{path} is shared by every page object; selecting every test")
+                return set(nodeids)
+            if path.endswith(WORKBOOK_EXTENSIONS):
+                sheets = changed_sheets.get(path)
+                selected.update(
+                    nodeid for nodeid in nodeids if nodeid in self.tests
+                    and path in self.tests[nodeid]["sheets"]
+                    and (sheets is None or sheets & set(self.tests[nodeid]["sheets"][path]))
+                )
+            elif path in test_files:
+                selected.update(nodeid for nodeid in nodeids if nodeid.split("::")[0] == path)
+            elif path in page_files:
+                selected.update(
+                    nodeid for nodeid in nodeids if nodeid in self.tests and path in self.tests[nodeid]["files"]
+                )
+            elif not path.endswith(DOCUMENTATION_EXTENSIONS):
+                self.logger.info(f"{path} is not tracked by the impact index; selecting every test")
+                return set(nodeids)
+        return selected
+
+
+def changed_files(base_ref, root=None):
+    """
+    Files changed between a git revision and the working tree, including untracked files.
+
+    :param base_ref: Git revision to compare with.
+    :param root: Repository root.
+    :return: List of paths relative to the root.
+    """
+    diff = _git(["diff", "--name-only", base_ref], root)
+    untracked = _git(["ls-files", "--others", "--exclude-standard"], root)
+    return sorted({line for line in (diff + untracked).splitlines() if line})
+
+
+def changed_sheets(base_ref, path, root=None):
+    """
+    Compare the sheets of a workbook with its version at a git revision.
+
+    :param base_ref: Git revision to compare with.
+    :param path: Workbook path relative to the root.
+    :param root: Repository root.
+    :return: Set of changed, added or removed sheet names, or None if the old version is unavailable.
+    """
+    from openpyxl import load_workbook
+
+    try:
+        old_content = subprocess.run(
+            ["git", "show", f"{base_ref}:{path}"], cwd=root, capture_output=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError:
+        return None
+    full_path = os.path.join(root or os.getcwd(), path)
+    if not os.path.exists(full_path):
+        return None
+    old = _sheet_values(load_workbook(io.BytesIO(old_content), data_only=True))
+    new = _sheet_values(load_workbook(full_path, data_only=True))
+    return {name for name in set(old) | set(new) if old.get(name) != new.get(name)}
+
+
+def select_tests(base_ref, index, nodeids, root=None):
+    """
+    Select the collected tests affected by the changes since a git revision.
+
+    :param base_ref: Git revision to compare with.
+    :param index: DependencyIndex
+    :param nodeids: Collected node ids.
+    :param root: Repository root.
+    :return: Set of selected node ids.
+    """
+    files = changed_files(base_ref, root)
+    sheets = {}
+    for path in files:
+        if path.endswith(WORKBOOK_EXTENSIONS):
+            changed = changed_sheets(base_ref, path, root)
+            if changed is not None:
+                sheets[path] = changed
+    return index.affected(files, sheets, nodeids)
+
+
+def enable_tracking(root=None):
+    """
+    Create an ImpactTracker and make it the active one.
+    """
+    global _active_tracker
+    _active_tracker = ImpactTracker(root)
+    return _active_tracker
+
+
+def disable_tracking():
+    global _active_tracker
+    _active_tracker = None
+
+
+def current_tracker():
+    """
+    Return the active ImpactTracker, or None when tracking is disabled.
+    """
+    return _active_tracker
+
+
+def _sheet_values(workbook):
+    return {sheet.title: [list(row) for row in sheet.iter_rows(values_only=True)] for sheet in workbook.worksheets}
+
+
+def _git(args, root):
+    return subprocess.run(["git"] + args, cwd=root, capture_output=True, text=True, check=True).stdout
@@ -0,0 +1,252 @@
+import os
+import re
+from src.utils.logger import get_logger
+
+# Actions whose duration is dominated by locating the element.
+RESOLVING_ACTIONS = {"find_element", "find_elements", "click", "is_element_displayed"}
+
+# Actions that expect exactly one element to match.
+SINGLE_ELEMENT_ACTIONS = {"find_element", "click", "is_element_displayed"}
+
+# Actions that may change the DOM (submit a form, follow a link). BasePage inspects their
+# locator through LocatorAnalyzer.inspect() before acting, since the DOM afterwards may be gone.
+MUTATING_ACTIONS = {"click"}
+
+# Directory for the per-page-class reports.
+REPORT_DIR = os.path.join("reports", "locators")
+
+# Runs in the browser against the first matched element and returns the first
+# cheaper locator that is unique in the live DOM, as [by, value], or null.
+SUGGEST_SCRIPT = """
+var el = arguments[0];
+if (!el || !el.tagName) { return null; }
+function unique(selector) {
+    try { return document.querySelectorAll(selector).length === 1; } catch (e) { return false; }
+}
+function esc(value) {
+    return (window.CSS && CSS.escape) ? CSS.escape(value) : value.replace(/([^\\w-])/g, '\\\\$1');
+}
+function quote(value) { return '"' + value.replace(/(["\\\\])/g, '\\\\$1') + '"'; }
+if (el.id && unique('#' + esc(el.id))) { return ['id', el.id]; }
+var attrs = ['data-testid', 'data-test-id', 'data-test', 'data-qa'];
+for (var i = 0; i < attrs.length; i++) {
+    var value = el.getAttribute(attrs[i]);
+    if (value) {
+        var selector = '[' + attrs[i] + '=' + quote(value) + ']';
+        if (unique(selector)) { return ['css selector', selector]; }
+    }
+}
+var tag = el.tagName.toLowerCase();
+var name = el.getAttribute('name');
+if (name && unique(tag + '[name=' + quote(name) + ']')) { return ['css selector', tag + '[name=' + quote(name) + ']']; }
+if (el.classList && el.classList.length) {
+    var classes = tag + '.' + Array.prototype.map.call(el.classList, esc).join('.');
+    if (unique(classes)) { return ['css selector', classes]; }
+}
+return null;
+"""
+
+_active_analyzer = None
+
+
+class LocatorStats:
+    """
+    Aggregated resolution statistics of one locator used by one page class.
+    """
+
+    def __init__(self, page_class, locator):
+        self.page_class = page_class
+        self.locator = locator
+        self.uses = 0
+        self.timeouts = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.match_count = None
+        self.single_element = False
+        self.suggestion = None
+        self.inspected = False
+
+    @property
+    def average_time(self):
+        resolved = self.uses - self.timeouts
+        return self.total_time / resolved if resolved else 0.0
+
+
+class LocatorAnalyzer:
+    """
+    LocatorAnalyzer records every locator resolved through BasePage together with
+    its resolution time and match count, flags slow, ambiguous and fragile locators
+    and suggests faster equivalents (id, data-testid, short CSS) from the live DOM.
+
+    Example usage:
+        analyzer = enable_analysis(slow_threshold=0.5)
+        ...  # run page-object code
+        analyzer.write_reports()
+        disable_analysis()
+    """
+
+    def __init__(self, slow_threshold=0.5, max_xpath_depth=4):
+        """
+        Initialize the analyzer.
+
+        :param slow_threshold: Average resolution time, in seconds, above which a locator is slow.
+        :param max_xpath_depth: Number of XPath steps above which a locator is considered deep.
+        """
+        self.slow_threshold = slow_threshold
+        self.max_xpath_depth = max_xpath_depth
+        self.stats = {}
+        self.logger = get_logger(self.__class__.__name__)
+
+    def record(self, page, action, locator, duration, detail=None):
+        """
+        Record one resolution of a locator by a page object.
+        The match count and suggestion are computed once, on first sighting, unless
+        a successful MUTATING_ACTIONS may have changed the page since it was resolved.
+
+        :param page: The BasePage instance performing the action.
+        :param action: Name of the BasePage action.
+        :param locator: Tuple (By.<METHOD>, "value")
+        :param duration: Time spent in the action, in seconds.
+        :param detail: Optional detail reported by BasePage (e.g. 'timeout').
+        """
+        if action not in RESOLVING_ACTIONS:
+            return
+        stats = self._stats(page, locator)
+        if not stats.inspected and (detail or action not in MUTATING_ACTIONS):
+            self._inspect(page.driver, stats)
+        stats.uses += 1
+        stats.single_element = stats.single_element or action in SINGLE_ELEMENT_ACTIONS
+        if detail:
+            stats.timeouts += 1
+            return
+        stats.total_time += duration
+        stats.max_time = max(stats.max_time, duration)
+
+    def inspect(self, page, locator):
+        """
+        Count the matches of a locator and compute its suggestion in the current DOM,
+        if not done yet. Called by BasePage right before a MUTATING_ACTIONS.
+
+        :param page: The BasePage instance about to act.
+        :param locator: Tuple (By.<METHOD>, "value")
+        """
+        stats = self._stats(page, locator)
+        if not stats.inspected:
+            self._inspect(page.driver, stats)
+
+    def flags(self, stats):
+        """
+        Return the list of problems detected for a locator.
+
+        :param stats: LocatorStats instance.
+        :return: List of short flag names.
+        """
+        by, value = stats.locator
+        found = []
+        if stats.average_time > self.slow_threshold:
+            found.append("slow")
+        if stats.timeouts:
+            found.append("timeouts")
+        if stats.single_element and stats.match_count and stats.match_count > 1:
+            found.append("ambiguous")
+        if by == "xpath":
+            if value.startswith("/") and not value.startswith("//"):
+                found.append("absolute-xpath")
+            if len([step for step in re.split(r"/+", value) if step]) > self.max_xpath_depth:
+                found.append("deep-xpath")
+            if re.search(r"contains\(\s*text\(\)", value) or "text()=" in value.replace(" ", ""):
+                found.append("text-match")
+        return found
+
+    def report(self, page_class):
+        """
+        Build a text report for the locators of a page class, worst first.
+
+        :param page_class: Qualified name (module.Class) of the page class.
+        :return: The report as a string.
+        """
+        rows = [stats for stats in self.stats.values() if stats.page_class == page_class]
+        rows.sort(key=lambda s: (len(self.flags(s)) == 0, -s.average_time))
+        lines = [f"Locator report for {page_class}", ""]
+        for stats in rows:
+            flags = self.flags(stats)
+            lines.append(f"{stats.locator}")
+            lines.append(
+                f"  uses={stats.uses} avg={stats.average_time * 1000:.1f}ms "
+                f"max={stats.max_time * 1000:.1f}ms matches={stats.match_count} timeouts={stats.timeouts}"
+            )
+            if flags:
+                lines.append(f"  flags: {', '.join(flags)}")
+                if stats.suggestion:
+                    lines.append(f"  suggestion: {stats.suggestion}")
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, directory=REPORT_DIR):
+        """
+        Write one report file per page class.
+
+        :param directory: Output directory.
+        :return: List of written file paths.
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for page_class in sorted({stats.page_class for stats in self.stats.values()}):
+            path = os.path.join(directory, f"{page_class}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.report(page_class))
+            paths.append(path)
+        self.logger.info(f"Locator reports written for {len(paths)} page classes to {directory}")
+        return paths
+
+    def _stats(self, page, locator):
+        page_class = f"{page.__class__.__module__}.{page.__class__.__qualname__}"
+        key = (page_class, tuple(locator))
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = LocatorStats(page_class, key[1])
+        return stats
+
+    def _inspect(self, driver, stats):
+        stats.inspected = True
+        by, value = stats.locator
+        try:
+            elements = driver.find_elements(by, value)
+        except Exception as e:
+            self.logger.warning(f"Could not count matches for {stats.locator}: {e}")
+            return
+        stats.match_count = len(elements)
+        if not elements or by == "id":
+            return
+        try:
+            suggestion = driver.execute_script(SUGGEST_SCRIPT, elements[0])
+        except Exception as e:
+            self.logger.warning(f"Could not compute a suggestion for {stats.locator}: {e}")
+            return
+        if suggestion and tuple(suggestion) != stats.locator:
+            stats.suggestion = tuple(suggestion)
+
+
+def enable_analysis(**kwargs):
+    """
+    Create a LocatorAnalyzer and make it the active one.
+
+    :return: The new LocatorAnalyzer.
+    """
+    global _active_analyzer
+    _active_analyzer = LocatorAnalyzer(**kwargs)
+    return _active_analyzer
+
+
+def disable_analysis():
+    """
+    Stop analyzing locators.
+    """
+    global _active_analyzer
+    _active_analyzer = None
+
+
+def current_analyzer():
+    """
+    Return the active LocatorAnalyzer, or None when analysis is disabled.
+    """
+    return _active_analyzer
@@ -1,39 +1,50 @@
 import logging
 import os
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure_logging():
+    """
+    Attach the console and file handlers to the root logger, once per process.
+
+    Every logger propagates to the root, so each record is written exactly once
+    to the console and to 'reports/logs/automation.log', whether it comes from
+    get_logger() or from a third-party library.
+    """
+    root = logging.getLogger()
+    if any(getattr(handler, "_automation_handler", False) for handler in root.handlers):
+        return
+    root.setLevel(logging.DEBUG)
+
+    # Define a common formatter
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    # Console handler configuration
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    console_handler.setFormatter(formatter)
+
+    # Ensure the log directory exists
+    log_dir = os.path.join(os.getcwd(), "reports", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    # File handler configuration (the file is opened on the first record, not here)
+    file_handler = logging.FileHandler(os.path.join(log_dir, "automation.log"), delay=True)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+
+    for handler in (console_handler, file_handler):
+        handler._automation_handler = True
+        root.addHandler(handler)
+
 
 def get_logger(name=__name__):
     """
     Returns a logger instance with a specified name.
 
-    Configures the logger to output to both the console and a file.
-    Log files are stored in 'reports/logs/automation.log'.
+    The logger has no handlers of its own: records propagate to the console and
+    file handlers installed on the root logger by configure_logging(), which is
+    called by the test session (conftest) and the command-line entry points.
     """
-    logger = logging.getLogger(name)
-
-    # Prevent adding duplicate handlers if the logger is already configured
-    if not logger.handlers:
-        logger.setLevel(logging.DEBUG)
-
-        # Define a common formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-
-        # Console handler configuration
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-        # Ensure the log directory exists
-        log_dir = os.path.join(os.getcwd(), "reports", "logs")
-        os.makedirs(log_dir, exist_ok=True)
-
-        # File handler configuration
-        file_handler = logging.FileHandler(os.path.join(log_dir, "automation.log"))
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    return logger
+    return logging.getLogger(name)
@@ -0,0 +1,241 @@
+import argparse
+import collections
+import heapq
+import html
+import os
+import shutil
+import tempfile
+import time
+from src.utils.logger import configure_logging, get_logger
+from src.utils.run_events import EVENTS_PATH, read_events
+
+# Default location of the HTML report.
+REPORT_PATH = os.path.join("reports", "html", "report.html")
+
+# Number of most recent actions kept for the timeline of a failed test.
+TIMELINE_ACTIONS = 50
+
+# Number of tests listed in the "slowest tests" table.
+SLOWEST_TESTS = 20
+
+STYLE = """
+body { font-family: sans-serif; margin: 1.5em; color: #222; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+th, td { border: 1px solid #ccc; padding: 2px 8px; text-align: left; font-size: 13px; vertical-align: top; }
+.passed { color: #1a7f37; } .failed { color: #cf222e; } .skipped, .interrupted { color: #9a6700; }
+pre { white-space: pre-wrap; font-size: 12px; background: #f6f8fa; padding: 6px; margin: 4px 0; }
+img { max-width: 480px; border: 1px solid #ccc; }
+"""
+
+
+class _TestState:
+    """
+    Events of a test that has started but not finished yet.
+    """
+
+    __slots__ = ("started", "actions", "action_time", "timeline", "artifacts")
+
+    def __init__(self, started):
+        self.started = started
+        self.actions = 0
+        self.action_time = 0.0
+        self.timeline = collections.deque(maxlen=TIMELINE_ACTIONS)
+        self.artifacts = []
+
+
+class ReportBuilder:
+    """
+    ReportBuilder renders an HTML summary of a run from its event stream in a single
+    streaming pass. Only the tests in flight, per-action aggregates and the top
+    SLOWEST_TESTS are held in memory; the rows of finished tests go straight to
+    temporary files that are concatenated once the summary is known, so memory stays
+    bounded whatever the number of tests.
+
+    Example usage:
+        ReportBuilder("reports/events/events.jsonl").build("reports/html/report.html")
+    """
+
+    def __init__(self, events_path=EVENTS_PATH):
+        """
+        :param events_path: Event stream written by EventStream.
+        """
+        self.events_path = events_path
+        self.output_dir = None
+        self.logger = get_logger(self.__class__.__name__)
+
+    def build(self, output_path=REPORT_PATH, include_passed=True):
+        """
+        Render the report.
+
+        :param output_path: HTML file to write; its directory is created when missing.
+        :param include_passed: List passed and skipped tests in the table of all tests.
+        :return: Dict of outcome to number of tests.
+        """
+        output_dir = self.output_dir = os.path.dirname(output_path) or "."
+        os.makedirs(output_dir, exist_ok=True)
+        outcomes = collections.Counter()
+        actions = {}
+        slowest = []
+        running = {}
+        session = {}
+        total_duration = 0.0
+
+        with tempfile.TemporaryFile("w+", encoding="utf-8", dir=output_dir) as failures, \
+                tempfile.TemporaryFile("w+", encoding="utf-8", dir=output_dir) as rows:
+
+            def finish(test, state, outcome, duration, message=None):
+                outcomes[outcome] += 1
+                entry = (duration, test)
+                if len(slowest) < SLOWEST_TESTS:
+                    heapq.heappush(slowest, entry)
+                else:
+                    heapq.heappushpop(slowest, entry)
+                if outcome in ("failed", "interrupted"):
+                    failures.write(self._failure(test, state, outcome, duration, message))
+                if include_passed or outcome not in ("passed", "skipped"):
+                    rows.write(self._row(test, state, outcome, duration))
+
+            for event in read_events(self.events_path):
+                kind, test = event.get("event"), event.get("test")
+                if kind == "action":
+                    state = running.get(test)
+                    duration = event.get("duration") or 0.0
+                    stats = actions.setdefault(event.get("action"), [0, 0.0, 0.0])
+                    stats[0] += 1
+                    stats[1] += duration
+                    stats[2] = max(stats[2], duration)
+                    if state is not None:
+                        state.actions += 1
+                        state.action_time += duration
+                        state.timeline.append(event)
+                elif kind == "test_start":
+                    running[test] = _TestState(event["ts"])
+                elif kind == "artifact":
+                    state = running.get(test)
+                    if state is not None:
+                        state.artifacts.append((event.get("kind"), event.get("path")))
+                elif kind == "test_finish":
+                    state = running.pop(test, None) or _TestState(event["ts"])
+                    total_duration += event.get("duration", 0.0)
+                    finish(test, state, event.get("outcome", "passed"), event.get("duration", 0.0),
+                           event.get("message"))
+                elif kind in ("session_start", "session_finish"):
+                    session[kind] = event
+
+            # Tests still running when the stream ended were interrupted (crash, timeout, Ctrl+C).
+            for test, state in running.items():
+                finish(test, state, "interrupted", 0.0, "The run ended before this test finished.")
+
+            with open(output_path, "w", encoding="utf-8") as report:
+                report.write(self._header(session, outcomes, total_duration))
+                report.write(self._action_table(actions))
+                report.write(self._slowest_table(slowest))
+                report.write(f"<h2>Failures ({outcomes['failed'] + outcomes['interrupted']})</h2>\n")
+                failures.seek(0)
+                shutil.copyfileobj(failures, report)
+                report.write("<h2>All tests</h2>\n<table>\n"
+                             "<tr><th>Test</th><th>Outcome</th><th>Duration</th>"
+                             "<th>Actions</th><th>Action time</th></tr>\n")
+                rows.seek(0)
+                shutil.copyfileobj(rows, report)
+                report.write("</table>\n</body></html>\n")
+
+        self.logger.info(f"HTML report for {sum(outcomes.values())} tests written to {output_path}")
+        return dict(outcomes)
+
+    def _header(self, session, outcomes, total_duration):
+        started = session.get("session_start", {}).get("ts")
+        finished = session.get("session_finish", {}).get("ts")
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(started)) if started else "unknown"
+        wall = f"{finished - started:.1f}s" if started and finished else "unfinished"
+        counts = ", ".join(f'<span class="{outcome}">{count} {outcome}</span>'
+                           for outcome, count in sorted(outcomes.items()))
+        return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Test run {when}</title>"
+                f"<style>{STYLE}</style></head><body>\n"
+                f"<h1>Test run {when}</h1>\n"
+                f"<p>{sum(outcomes.values())} tests: {counts or 'none'}. "
+                f"Wall time {wall}, summed test time {total_duration:.1f}s.</p>\n")
+
+    def _action_table(self, actions):
+        lines = ["<h2>Page actions</h2>\n<table>\n"
+                 "<tr><th>Action</th><th>Count</th><th>Total</th><th>Average</th><th>Max</th></tr>\n"]
+        for action, (count, total, longest) in sorted(actions.items(), key=lambda item: -item[1][1]):
+            lines.append(f"<tr><td>{_e(action)}</td><td>{count}</td><td>{total:.2f}s</td>"
+                         f"<td>{total / count * 1000:.1f} ms</td><td>{longest * 1000:.1f} ms</td></tr>\n")
+        lines.append("</table>\n")
+        return "".join(lines)
+
+    def _slowest_table(self, slowest):
+        lines = [f"<h2>Slowest tests</h2>\n<table>\n<tr><th>Test</th><th>Duration</th></tr>\n"]
+        for duration, test in sorted(slowest, reverse=True):
+            lines.append(f"<tr><td>{_e(test)}</td><td>{duration:.2f}s</td></tr>\n")
+        lines.append("</table>\n")
+        return "".join(lines)
+
+    def _row(self, test, state, outcome, duration):
+        return (f'<tr><td>{_e(test)}</td><td class="{outcome}">{outcome}</td><td>{duration:.2f}s</td>'
+                f"<td>{state.actions}</td><td>{state.action_time:.2f}s</td></tr>\n")
+
+    def _failure(self, test, state, outcome, duration, message):
+        lines = [f'<details><summary class="{outcome}">{_e(test)} ({duration:.2f}s)</summary>\n']
+        if message:
+            lines.append(f"<pre>{_e(message)}</pre>\n")
+        if state.timeline:
+            skipped = state.actions - len(state.timeline)
+            lines.append(f"<p>Last {len(state.timeline)} of {state.actions} actions:</p><pre>")
+            if skipped:
+                lines.append(f"... {skipped} earlier actions\n")
+            for event in state.timeline:
+                lines.append(_e(_format_action(event)) + "\n")
+            lines.append("</pre>\n")
+        lines.append(self._artifacts(state.artifacts))
+        lines.append("</details>\n")
+        return "".join(lines)
+
+    def _artifacts(self, artifacts):
+        """
+        Link the artifacts of a test relative to the report, inlining screenshots.
+        Artifact directories are expanded to the files they contain.
+        """
+        lines = []
+        for kind, path in artifacts:
+            paths = [path]
+            if path and os.path.isdir(path):
+                paths = [os.path.join(path, name) for name in sorted(os.listdir(path))]
+            for file_path in paths:
+                link = _e(os.path.relpath(file_path, self.output_dir).replace(os.sep, "/"))
+                if file_path.endswith(".png"):
+                    lines.append(f'<p><a href="{link}"><img src="{link}" alt="{_e(kind)}"></a></p>\n')
+                else:
+                    lines.append(f'<p>{_e(kind)}: <a href="{link}">{_e(os.path.basename(file_path))}</a></p>\n')
+        return "".join(lines)
+
+
+def _e(value):
+    return html.escape(str(value))
+
+
+def _format_action(event):
+    line = time.strftime("%H:%M:%S", time.localtime(event["ts"])) + f" {event.get('action')}"
+    if event.get("locator") is not None:
+        line += f" {tuple(event['locator'])}"
+    if event.get("duration") is not None:
+        line += f" ({event['duration'] * 1000:.1f} ms)"
+    if event.get("detail"):
+        line += f" [{event['detail']}]"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render an HTML report from a run's event stream.")
+    parser.add_argument("events", nargs="?", default=EVENTS_PATH)
+    parser.add_argument("-o", "--output", default=REPORT_PATH)
+    parser.add_argument("--failures-only", action="store_true", help="Leave passed and skipped tests out of the table.")
+    args = parser.parse_args()
+    configure_logging()
+    outcomes = ReportBuilder(args.events).build(args.output, include_passed=not args.failures_only)
+    print(f"{args.output}: {outcomes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import json
+import os
+import time
+from src.utils.logger import get_logger
+
+# Default location of the event stream of the current run.
+EVENTS_PATH = os.path.join("reports", "events", "events.jsonl")
+
+_active_stream = None
+
+
+class EventStream:
+    """
+    EventStream appends one compact JSON object per line to a file while the run
+    progresses, so reports can be built from it without re-parsing text logs and a
+    crashed run still leaves every event up to the crash on disk.
+
+    Every event has an 'event' type and a 'ts' (epoch seconds):
+      - session_start / session_finish
+      - test_start:  test
+      - action:      test, action, locator, duration, detail
+      - artifact:    test, kind, path
+      - test_finish: test, outcome, duration, message
+
+    Example usage:
+        stream = start_stream("reports/events/events.jsonl")
+        stream.test_start("tests/test_login.py::test_ok")
+        stream.action("click", ("id", "submit"), 0.12)
+        stream.test_finish("tests/test_login.py::test_ok", "passed", 1.4)
+        stop_stream()
+    """
+
+    def __init__(self, path=EVENTS_PATH, append=False):
+        """
+        :param path: File the events are written to; its directory is created when missing.
+        :param append: Append to an existing file instead of starting a new one.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.test = None
+        self.file = open(path, "a" if append else "w", encoding="utf-8")
+        self.logger = get_logger(self.__class__.__name__)
+
+    def emit(self, event, **fields):
+        """
+        Append an event. Fields that are None are left out.
+
+        :param event: Event type.
+        :param fields: JSON-serializable event fields.
+        """
+        record = {"event": event, "ts": round(time.time(), 3)}
+        record.update((key, value) for key, value in fields.items() if value is not None)
+        self.file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+    def session_start(self, **fields):
+        self.emit("session_start", **fields)
+        self.file.flush()
+
+    def test_start(self, test):
+        self.test = test
+        self.emit("test_start", test=test)
+
+    def action(self, action, locator=None, duration=None, detail=None):
+        """
+        Append a page action of the current test.
+
+        :param action: Name of the action (e.g. 'click').
+        :param locator: Optional tuple (By.<METHOD>, "value").
+        :param duration: Optional time spent in the action, in seconds.
+        :param detail: Optional short detail (e.g. 'timeout').
+        """
+        self.emit("action", test=self.test, action=action,
+                  locator=list(locator) if locator is not None else None,
+                  duration=round(duration, 4) if duration is not None else None, detail=detail)
+
+    def artifact(self, test, kind, path):
+        """
+        Append a file produced for a test (e.g. a failure artifact directory or a screenshot).
+
+        :param test: The pytest node id.
+        :param kind: Kind of artifact, e.g. 'failure' or 'screenshot'.
+        :param path: Path of the file or directory.
+        """
+        self.emit("artifact", test=test, kind=kind, path=path)
+
+    def test_finish(self, test, outcome, duration, message=None):
+        """
+        Append the outcome of a test and flush the file, so the events of
+        every finished test are on disk.
+
+        :param test: The pytest node id.
+        :param outcome: 'passed', 'failed' or 'skipped'.
+        :param duration: Duration of setup, call and teardown, in seconds.
+        :param message: Failure message, if any.
+        """
+        self.emit("test_finish", test=test, outcome=outcome, duration=round(duration, 4), message=message)
+        self.test = None
+        self.file.flush()
+
+    def close(self, **fields):
+        """
+        Append a session_finish event and close the file.
+        """
+        self.emit("session_finish", **fields)
+        self.file.close()
+
+
+def start_stream(path=EVENTS_PATH, append=False):
+    """
+    Open an event stream and make it the active one.
+
+    :param path: File the events are written to.
+    :param append: Append to an existing file instead of starting a new one.
+    :return: The new EventStream.
+    """
+    global _active_stream
+    _active_stream = EventStream(path, append)
+    return _active_stream
+
+
+def stop_stream(**fields):
+    """
+    Close the active event stream, if any.
+
+    :param fields: Extra fields of the session_finish event.
+    """
+    global _active_stream
+    stream, _active_stream = _active_stream, None
+    if stream is not None:
+        stream.close(**fields)
+
+
+def current_stream():
+    """
+    Return the active EventStream, or None when events are not recorded.
+    """
+    return _active_stream
+
+
+def read_events(path):
+    """
+    Iterate over the events of a stream file one at a time. A truncated last line
+    (left by an interrupted run) is skipped.
+
+    :param path: Event stream file.
+    :return: Iterator of event dicts.
+    """
+    with open(path, encoding="utf-8") as events:
+        for line in events:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,323 @@
+import argparse
+import os
+import sqlite3
+import statistics
+import time
+import zlib
+from src.utils.logger import configure_logging, get_logger
+
+# Default location of the run-history database.
+HISTORY_PATH = os.path.join("reports", "history", "history.db")
+
+# Number of most recent runs of a test considered for durations and flakiness.
+WINDOW = 20
+
+# A test that failed in one of its last RECENT_FAILURE_RUNS runs is ordered first.
+RECENT_FAILURE_RUNS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    page_actions INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+"""
+
+
+class TestStats:
+    """
+    Summary of the recent history of one test.
+    """
+
+    __test__ = False  # Not a pytest test class.
+
+    def __init__(self, nodeid, durations, outcomes, page_actions, last_failure):
+        self.nodeid = nodeid
+        self.durations = durations
+        self.outcomes = outcomes
+        self.page_actions = page_actions
+        self.last_failure = last_failure
+
+    @property
+    def average_duration(self):
+        return statistics.mean(self.durations) if self.durations else None
+
+    @property
+    def flakiness(self):
+        """
+        Share of consecutive runs whose outcome flipped between passed and failed.
+        """
+        outcomes = [outcome for outcome in self.outcomes if outcome in ("passed", "failed")]
+        if len(outcomes) < 2:
+            return 0.0
+        flips = sum(1 for previous, current in zip(outcomes, outcomes[1:]) if previous != current)
+        return flips / (len(outcomes) - 1)
+
+    @property
+    def recently_failed(self):
+        return "failed" in self.outcomes[-RECENT_FAILURE_RUNS:]
+
+
+class RunHistory:
+    """
+    RunHistory persists per-test outcomes and durations of every run in a local SQLite
+    database and derives orderings from them: fail-fast (recent failures, then fastest
+    tests first) and longest-first packing of tests into parallel shards.
+
+    Every shard runner must compute its split from the same history file and the same
+    base run (see shards()), otherwise tests end up in no shard or in several.
+
+    Example usage:
+        history = RunHistory()
+        run_id = history.start_run()
+        history.record(run_id, "tests/test_login.py::test_ok", "passed", 1.2)
+        history.finish_run(run_id)
+        ordered = history.order_fail_fast(nodeids)
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        """
+        :param path: SQLite database file; created when missing.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.logger = get_logger(self.__class__.__name__)
+
+    def start_run(self):
+        """
+        :return: Id of the new run.
+        """
+        cursor = self.connection.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),))
+        self.connection.commit()
+        return cursor.lastrowid
+
+    def record(self, run_id, nodeid, outcome, duration, page_actions=0, message=None):
+        """
+        Record and commit the result of a test, so a crashed or killed run keeps the
+        results of the tests that finished.
+
+        :param run_id: Id returned by start_run().
+        :param nodeid: The pytest node id.
+        :param outcome: 'passed', 'failed' or 'skipped'.
+        :param duration: Duration of setup, call and teardown, in seconds.
+        :param page_actions: Number of BasePage actions the test performed.
+        :param message: Failure message, if any.
+        """
+        self.connection.execute(
+            "INSERT INTO results (run_id, nodeid, outcome, duration, page_actions, message, finished_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (run_id, nodeid, outcome, duration, page_actions, message, time.time()),
+        )
+        self.connection.commit()
+
+    def finish_run(self, run_id):
+        self.connection.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (time.time(), run_id))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def latest_run(self):
+        """
+        :return: Id of the most recent finished run, or None for an empty history.
+        """
+        return self.connection.execute("SELECT MAX(id) FROM runs WHERE finished_at IS NOT NULL").fetchone()[0]
+
+    def stats(self, nodeids=None, until_run=None):
+        """
+        Summarize the last WINDOW runs of each test.
+
+        :param nodeids: Optional node ids to restrict to.
+        :param until_run: Optional run id; later runs are ignored.
+        :return: Dict of node id to TestStats, oldest run first in each series.
+        """
+        rows = self.connection.execute(
+            "SELECT nodeid, run_id, outcome, duration, page_actions, message, finished_at FROM ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC, rowid DESC) AS age"
+            "  FROM results WHERE ? IS NULL OR run_id <= ?"
+            f") WHERE age <= {WINDOW} ORDER BY nodeid, age DESC",
+            (until_run, until_run),
+        ).fetchall()
+        wanted = set(nodeids) if nodeids is not None else None
+        series = {}
+        for nodeid, run_id, outcome, duration, page_actions, message, finished_at in rows:
+            if wanted is not None and nodeid not in wanted:
+                continue
+            entry = series.setdefault(nodeid, {"durations": [], "outcomes": [], "actions": [], "failure": None})
+            entry["outcomes"].append(outcome)
+            entry["actions"].append(page_actions)
+            if outcome != "skipped":
+                entry["durations"].append(duration)
+            if outcome == "failed":
+                entry["failure"] = (finished_at, message, run_id)
+        return {
+            nodeid: TestStats(nodeid, entry["durations"], entry["outcomes"],
+                              statistics.mean(entry["actions"]), entry["failure"])
+            for nodeid, entry in series.items()
+        }
+
+    def order_fail_fast(self, nodeids):
+        """
+        Order tests for fast feedback: tests that failed recently first (latest failure first),
+        then by increasing average duration. Tests without history are treated as median-length.
+
+        :param nodeids: Node ids to order.
+        :return: Ordered list of node ids.
+        """
+        stats = self.stats(nodeids)
+        default = _median_duration(stats)
+
+        def key(nodeid):
+            test = stats.get(nodeid)
+            if test is not None and test.recently_failed:
+                return (0, -test.last_failure[2], -test.last_failure[0])
+            duration = test.average_duration if test is not None and test.durations else default
+            return (1, duration)
+
+        return sorted(nodeids, key=key)
+
+    def shards(self, nodeids, count, base_run=None):
+        """
+        Pack tests into shards of similar total duration, longest tests first
+        (each test goes to the currently shortest shard).
+
+        The split only uses runs up to base_run, so that every shard runner computes the
+        same split even though earlier shards have recorded their results meanwhile.
+        Without a base run, tests are split by a stable hash of their node id instead.
+
+        :param nodeids: Node ids to distribute.
+        :param count: Number of shards.
+        :param base_run: Run id shared by all shard runners, e.g. latest_run() taken before they start.
+        :return: List of `count` lists of node ids.
+        :raises ValueError: If base_run is not in this history (the runners do not share it).
+        """
+        if base_run is None:
+            self.logger.info("No base run pinned for sharding; splitting tests by node id hash")
+            return hash_shards(nodeids, count)
+        if self.connection.execute("SELECT 1 FROM runs WHERE id = ?", (base_run,)).fetchone() is None:
+            raise ValueError(f"Run {base_run} is not in {self.path}; all shard runners need the same history file.")
+
+        stats = self.stats(nodeids, until_run=base_run)
+        default = _median_duration(stats)
+
+        def duration(nodeid):
+            test = stats.get(nodeid)
+            return test.average_duration if test is not None and test.durations else default
+
+        shards = [[] for _ in range(count)]
+        totals = [0.0] * count
+        for nodeid in sorted(nodeids, key=lambda n: (-duration(n), n)):
+            target = totals.index(min(totals))
+            shards[target].append(nodeid)
+            totals[target] += duration(nodeid)
+        return shards
+
+    def trend_report(self, min_page_actions=1, limit=50):
+        """
+        Build a text report of duration trends for tests performing at least
+        min_page_actions BasePage actions on average, most slowed-down first.
+
+        :param min_page_actions: Threshold of average BasePage actions per run.
+        :param limit: Maximum number of tests listed.
+        :return: The report as a string.
+        """
+        rows = []
+        for test in self.stats().values():
+            if test.page_actions < min_page_actions or len(test.durations) < 2:
+                continue
+            half = max(len(test.durations) // 2, 1)
+            early = statistics.mean(test.durations[:half])
+            late = statistics.mean(test.durations[-half:])
+            change = (late - early) / early if early else 0.0
+            rows.append((change, test))
+        rows.sort(key=lambda row: -row[0])
+
+        lines = [f"Duration trends of BasePage-heavy tests (>= {min_page_actions} page actions, last {WINDOW} runs)", ""]
+        for change, test in rows[:limit]:
+            lines.append(test.nodeid)
+            lines.append(
+                f"  avg={test.average_duration:.2f}s change={change:+.0%} flakiness={test.flakiness:.0%} "
+                f"actions={test.page_actions:.0f} trend={_sparkline(test.durations)}"
+            )
+            if test.last_failure:
+                when = time.strftime("%Y-%m-%d %H:%M", time.localtime(test.last_failure[0]))
+                lines.append(f"  last failure {when}: {(test.last_failure[1] or '').splitlines()[0][:120]}")
+        return "\n".join(lines) + "\n"
+
+
+def parse_shard(value):
+    """
+    Parse a SHARD setting of the form 'i/n'.
+
+    :param value: Shard index (1-based) and number of shards, e.g. '2/4'.
+    :return: Tuple (i, n).
+    :raises ValueError: If the value is malformed or i is not between 1 and n.
+    """
+    try:
+        shard, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"SHARD={value!r} must have the form i/n, e.g. 2/4") from None
+    if not 1 <= shard <= count:
+        raise ValueError(f"SHARD={value!r} must satisfy 1 <= i <= n")
+    return shard, count
+
+
+def hash_shards(nodeids, count):
+    """
+    Split tests into shards by a stable hash of their node id; needs no run history,
+    so every shard runner computes the same split from the same node ids.
+
+    :param nodeids: Node ids to distribute.
+    :param count: Number of shards.
+    :return: List of `count` lists of node ids.
+    """
+    shards = [[] for _ in range(count)]
+    for nodeid in sorted(nodeids):
+        shards[zlib.crc32(nodeid.encode()) % count].append(nodeid)
+    return shards
+
+
+def _median_duration(stats):
+    averages = [test.average_duration for test in stats.values() if test.durations]
+    return statistics.median(averages) if averages else 0.0
+
+
+def _sparkline(values):
+    bars = "▁▂▃▄▅▆▇█"
+    low, high = min(values), max(values)
+    if high == low:
+        return bars[0] * len(values)
+    return "".join(bars[int((value - low) / (high - low) * (len(bars) - 1))] for value in values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show duration trends from the run-history database.")
+    parser.add_argument("--db", default=HISTORY_PATH)
+    parser.add_argument("--min-page-actions", type=float, default=1)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--latest-run", action="store_true",
+                        help="Print the id of the latest finished run, to pin as SHARD_BASE_RUN for all shards.")
+    args = parser.parse_args()
+    configure_logging()
+    history = RunHistory(args.db)
+    if args.latest_run:
+        print(history.latest_run() or "")
+        return
+    print(history.trend_report(args.min_page_actions, args.limit), end="")
+
+
+if __name__ == "__main__":
+    main()
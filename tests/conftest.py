@@ -1,9 +1,20 @@
 import sys
 import os
 import logging
+import subprocess
 import pytest
 from src.config.config import CONFIG
 from src.drivers.driver_factory import DriverFactory
+from src.drivers.appium_session import AppiumSessionManager
+from src.drivers.driver_health import DriverWatchdog
+from src.drivers.session_hygiene import HygienePolicy, SessionHygiene
+from src.utils import artifacts
+from src.utils import locator_analyzer
+from src.utils import impact
+from src.utils import run_events
+from src.utils.logger import configure_logging
+from src.utils.report_builder import ReportBuilder
+from src.utils.run_history import RunHistory, hash_shards, parse_shard
 
 # Ensure the project root is in the Python path.
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -13,23 +24,185 @@ if project_root not in sys.path:
 def setup_logging():
     """
     Configures the root logger to output logs to a centralized directory.
-    Logs are written to reports/logs/automation.log and also output to the console.
+    Logs are written to reports/logs/automation.log and also output to the console,
+    through the same handlers get_logger() relies on, so no record is written twice.
     """
-    log_dir = os.path.join(os.getcwd(), "reports", "logs")
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    configure_logging()
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(os.path.join(log_dir, "automation.log")),
-            logging.StreamHandler()
-        ]
-    )
 
-# Setup logging once when tests are collected.
-setup_logging()
+# Run history of the current session: database, run id and per-test results.
+_history = {"db": None, "run_id": None, "results": {}}
+
+# Node ids collected in this session, before any deselection; used to prune the impact index.
+_collected = set()
+
+
+def pytest_sessionstart(session):
+    """
+    Set up logging once per session rather than at conftest import, enable
+    the locator analyzer and impact tracking, and open the run history and event stream according to CONFIG.
+    """
+    setup_logging()
+    if CONFIG.get("EVENT_LOG"):
+        run_events.start_stream(CONFIG["EVENT_LOG"]).session_start(pid=os.getpid())
+    if CONFIG.get("ANALYZE_LOCATORS"):
+        locator_analyzer.enable_analysis()
+    if CONFIG.get("IMPACT_TRACKING"):
+        impact.enable_tracking(project_root)
+    if CONFIG.get("HISTORY_DB"):
+        _history["db"] = RunHistory(CONFIG["HISTORY_DB"])
+        _history["run_id"] = _history["db"].start_run()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Write the locator reports, merge this run into the impact index,
+    commit the run history and render the HTML report from the event stream.
+    """
+    analyzer = locator_analyzer.current_analyzer()
+    if analyzer is not None:
+        analyzer.write_reports()
+    tracker = impact.current_tracker()
+    if tracker is not None and (tracker.records or _collected):
+        index = impact.DependencyIndex.load(CONFIG["IMPACT_INDEX"])
+        index.update(tracker.records)
+        index.prune(_collected, project_root, _narrowed_modules(session.config))
+        index.save(CONFIG["IMPACT_INDEX"])
+    if _history["db"] is not None:
+        _history["db"].finish_run(_history["run_id"])
+        _history["db"].close()
+        _history["db"] = None
+    stream = run_events.current_stream()
+    if stream is not None:
+        run_events.stop_stream(exitstatus=int(exitstatus))
+        if CONFIG.get("HTML_REPORT"):
+            ReportBuilder(stream.path).build(CONFIG["HTML_REPORT"])
+
+
+def _narrowed_modules(config):
+    """
+    Modules given on the command line with a node id (path::name), relative to the project root.
+    """
+    modules = set()
+    for arg in config.args:
+        if "::" in arg:
+            path = os.path.join(str(config.invocation_params.dir), arg.split("::")[0])
+            modules.add(os.path.relpath(os.path.abspath(path), project_root).replace(os.sep, "/"))
+    return modules
+
+
+def pytest_itemcollected(item):
+    _collected.add(item.nodeid)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Narrow and order the collected tests:
+      - IMPACT_BASE_REF: keep only the tests affected by the changes since that git revision.
+      - SHARD=i/n: keep shard i (1-based) of n shards packed longest-first from the run history
+        up to SHARD_BASE_RUN, which every shard runner must share along with HISTORY_DB;
+        without a base run, or without HISTORY_DB, tests are split by node id hash.
+      - TEST_ORDER=fail-fast: run recently failed tests first, then the fastest ones.
+    """
+    selected = None
+    base_ref = CONFIG.get("IMPACT_BASE_REF")
+    if base_ref:
+        index = impact.DependencyIndex.load(CONFIG["IMPACT_INDEX"])
+        try:
+            selected = impact.select_tests(base_ref, index, [item.nodeid for item in items], project_root)
+        except subprocess.CalledProcessError as e:
+            reason = (e.stderr or "").strip().splitlines() or [str(e)]
+            raise pytest.UsageError(f"IMPACT_BASE_REF={base_ref!r} is not a valid git revision: {reason[0]}") from e
+
+    history = _history["db"]
+    if CONFIG.get("SHARD"):
+        base_run = CONFIG.get("SHARD_BASE_RUN")
+        candidates = [item.nodeid for item in items if selected is None or item.nodeid in selected]
+        try:
+            shard, count = parse_shard(CONFIG["SHARD"])
+            if history is not None:
+                shards = history.shards(candidates, count, base_run)
+            elif base_run is not None:
+                raise ValueError(f"SHARD_BASE_RUN={base_run} needs HISTORY_DB to be set")
+            else:
+                shards = hash_shards(candidates, count)
+        except ValueError as e:
+            raise pytest.UsageError(str(e)) from e
+        selected = set(shards[shard - 1])
+
+    if selected is not None:
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid in selected]
+
+    if history is not None and CONFIG.get("TEST_ORDER") == "fail-fast":
+        position = {nodeid: i for i, nodeid in enumerate(history.order_fail_fast([item.nodeid for item in items]))}
+        items.sort(key=lambda item: position[item.nodeid])
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Start an in-memory artifact buffer, impact recording and the test's events
+    before any fixture of the test runs.
+    """
+    artifacts.start_capture(item.nodeid)
+    stream = run_events.current_stream()
+    if stream is not None:
+        stream.test_start(item.nodeid)
+    tracker = impact.current_tracker()
+    if tracker is not None:
+        tracker.start_test(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Flush the artifact buffer, screenshot, page source and console logs to
+    reports/artifacts/<test> as soon as a phase fails, while the driver is still alive.
+    Passing tests never touch the disk.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    collector = artifacts.current_collector()
+    if report.failed and collector is not None and collector.test_id == item.nodeid:
+        artifact_dir = collector.flush()
+        report.sections.append(("failure artifacts", artifact_dir))
+        stream = run_events.current_stream()
+        if stream is not None:
+            stream.artifact(item.nodeid, "failure", artifact_dir)
+
+
+def pytest_runtest_logreport(report):
+    """
+    Accumulate the duration and outcome of every phase of a test for the run history and event stream.
+    """
+    if _history["db"] is None and run_events.current_stream() is None:
+        return
+    result = _history["results"].setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "message": None})
+    result["duration"] += report.duration
+    if report.failed:
+        result["outcome"] = "failed"
+        result["message"] = result["message"] or report.longreprtext[:2000]
+    elif report.skipped and result["outcome"] == "passed":
+        result["outcome"] = "skipped"
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    result = _history["results"].pop(nodeid, None)
+    if result is not None and _history["db"] is not None:
+        collector = artifacts.current_collector()
+        page_actions = collector.actions if collector is not None and collector.test_id == nodeid else 0
+        _history["db"].record(_history["run_id"], nodeid, result["outcome"], result["duration"],
+                              page_actions, result["message"])
+    stream = run_events.current_stream()
+    if result is not None and stream is not None:
+        stream.test_finish(nodeid, result["outcome"], result["duration"], result["message"])
+    artifacts.stop_capture()
+    tracker = impact.current_tracker()
+    if tracker is not None:
+        tracker.stop_test()
 
 @pytest.fixture
 def set_test_config(monkeypatch):
@@ -64,3 +237,50 @@ def real_webdriver(monkeypatch):
     driver = DriverFactory.get_driver("web")
     yield driver
     driver.quit()
+
+
+@pytest.fixture(scope="session")
+def driver_watchdog():
+    """
+    Session-wide watchdog owning a single shared web driver, with the HYGIENE_* policy
+    from CONFIG applied between tests. The driver is started on first use and quit
+    at the end of the session.
+    """
+    hygiene = SessionHygiene(HygienePolicy.from_config())
+    watchdog = DriverWatchdog(lambda: DriverFactory.get_driver("web"), hygiene=hygiene)
+    yield watchdog
+    watchdog.quit()
+    logging.getLogger("DriverWatchdog").info(f"Driver watchdog metrics: {watchdog.summary()}")
+
+
+@pytest.fixture(scope="function")
+def managed_webdriver(driver_watchdog):
+    """
+    Fixture for tests sharing one driver across the session.
+
+    Before each test the session is pinged and its process tree measured; a hung,
+    crashed or bloated session is killed and replaced so that the test gets a working driver
+    instead of failing after its full timeout.
+    """
+    yield driver_watchdog.ensure_healthy()
+
+
+@pytest.fixture(scope="session")
+def appium_session_manager():
+    """
+    Session-wide manager of the local Appium session, using CONFIG['MOBILE_RESET_POLICY'].
+    """
+    manager = AppiumSessionManager()
+    yield manager
+    manager.quit()
+    logging.getLogger("AppiumSessionManager").info(f"Appium session metrics: {manager.summary()}")
+
+
+@pytest.fixture(scope="function")
+def mobile_driver(appium_session_manager):
+    """
+    Fixture for local mobile tests. The app stays installed across tests and is
+    reset between them according to the reset policy.
+    """
+    yield appium_session_manager.acquire()
+    appium_session_manager.release()
@@ -0,0 +1,169 @@
+import http.server
+import json
+import threading
+import time
+import uuid
+import pytest
+from src.drivers.appium_session import AppiumSessionManager
+from src.drivers.driver_factory import DriverFactory
+from src.utils.logger import get_logger
+
+logger = get_logger("test_appium_session")
+
+# Simulated cost of installing the app when a session is created with fullReset.
+INSTALL_DELAY = 0.15
+
+
+class StubAppiumServer(http.server.ThreadingHTTPServer):
+    """
+    Minimal local Appium server: creates and deletes sessions and answers
+    'mobile: terminateApp' / 'mobile: activateApp'. Installing the app is simulated
+    by a delay on sessions created with appium:fullReset or before the first install.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubAppiumHandler)
+        self.sessions = {}
+        self.installs = 0
+        self.scripts = []
+        self.installed = False
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/wd/hub"
+
+
+class StubAppiumHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, value, status=200):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_POST(self):
+        server, body = self.server, self._body()
+        parts = self.path.split("/")[3:]  # drop '', 'wd', 'hub'
+        if parts == ["session"]:
+            capabilities = body["capabilities"]["alwaysMatch"]
+            if capabilities.get("appium:fullReset") or not server.installed:
+                time.sleep(INSTALL_DELAY)
+                server.installs += 1
+                server.installed = True
+            session_id = uuid.uuid4().hex
+            server.sessions[session_id] = capabilities
+            return self._reply({"sessionId": session_id, "capabilities": capabilities})
+        if len(parts) == 4 and parts[2:] == ["execute", "sync"]:
+            server.scripts.append((body["script"], body["args"][0]["appId"]))
+            return self._reply(True)
+        self._reply({"error": "unknown command", "message": self.path, "stacktrace": ""}, 404)
+
+    def do_DELETE(self):
+        self.server.sessions.pop(self.path.split("/")[-1], None)
+        self._reply(None)
+
+
+@pytest.fixture
+def appium_server(set_test_config):
+    server = StubAppiumServer()
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    set_test_config({
+        "USE_BROWSERSTACK": False,
+        "APPIUM_SERVER_URL": server.url,
+        "MOBILE_PLATFORM_NAME": "Android",
+        "MOBILE_APP_PATH": "/apps/demo.apk",
+        "MOBILE_APP_ID": "com.example.demo",
+    })
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_local_mobile_driver_uses_configured_server(appium_server, set_test_config):
+    set_test_config({"MOBILE_RESET_POLICY": "terminate"})
+
+    driver = DriverFactory.get_driver("mobile")
+
+    capabilities = appium_server.sessions[driver.session_id]
+    assert capabilities["platformName"] == "Android"
+    assert capabilities["appium:automationName"] == "UiAutomator2"
+    assert capabilities["appium:app"] == "/apps/demo.apk"
+    assert capabilities["appium:noReset"] is True
+    driver.quit()
+    assert appium_server.sessions == {}
+
+
+def test_terminate_policy_reuses_session_and_resets_app(appium_server):
+    manager = AppiumSessionManager(reset_policy="terminate")
+
+    session_ids = set()
+    for _ in range(3):
+        session_ids.add(manager.acquire().session_id)
+        manager.release()
+    manager.quit()
+
+    assert len(session_ids) == 1
+    assert appium_server.installs == 1
+    assert appium_server.scripts.count(("mobile: terminateApp", "com.example.demo")) == 3
+    assert appium_server.scripts.count(("mobile: activateApp", "com.example.demo")) == 3
+    assert manager.metrics["resets"] == 3
+
+
+def test_full_reset_policy_reinstalls_for_every_test(appium_server):
+    manager = AppiumSessionManager(reset_policy="fullReset")
+
+    session_ids = set()
+    for _ in range(3):
+        session_ids.add(manager.acquire().session_id)
+        manager.release()
+
+    assert len(session_ids) == 3
+    assert appium_server.installs == 3
+    assert appium_server.sessions == {}
+
+
+def test_terminate_policy_avoids_per_test_install(appium_server):
+    installs, managers = {}, {}
+    for policy in ["fullReset", "terminate"]:
+        manager = managers[policy] = AppiumSessionManager(reset_policy=policy)
+        before = appium_server.installs
+        started = time.perf_counter()
+        for _ in range(5):
+            manager.acquire()
+            manager.release()
+        manager.quit()
+        installs[policy] = appium_server.installs - before
+        logger.info("%s: %.3fs per test (%s)", policy, (time.perf_counter() - started) / 5, manager.summary())
+
+    assert installs["fullReset"] == 5
+    assert installs["terminate"] == 0  # the app was installed by the fullReset sessions
+    assert managers["fullReset"].metrics["sessions"] == 5
+    assert managers["terminate"].metrics["sessions"] == 1
+    assert managers["terminate"].metrics["resets"] == 5
+
+
+def test_failed_reset_drops_session(appium_server):
+    manager = AppiumSessionManager(reset_policy="terminate", app_id="com.example.demo")
+    first = manager.acquire()
+    first.terminate_app = lambda app_id: (_ for _ in ()).throw(RuntimeError("app crashed"))
+
+    manager.release()
+
+    assert manager.acquire() is not first
+    manager.quit()
+
+
+def test_terminate_policy_requires_app_id(set_test_config):
+    set_test_config({"MOBILE_APP_ID": ""})
+    with pytest.raises(ValueError):
+        AppiumSessionManager(reset_policy="terminate")
+    with pytest.raises(ValueError):
+        AppiumSessionManager(reset_policy="sometimes")
@@ -0,0 +1,111 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from src.pages.base_page import BasePage
+from src.utils import artifacts
+from src.utils.artifacts import ArtifactCollector
+from src.utils.logger import get_logger
+
+
+class DummyDriver:
+    """
+    A simple dummy driver exposing the debugging surface used on failure.
+    """
+
+    def __init__(self):
+        self.title = "Dummy Title"
+        self.page_source = "<html><body>dummy</body></html>"
+
+    def save_screenshot(self, file_name):
+        with open(file_name, "wb") as f:
+            f.write(b"png")
+        return True
+
+    def get_log(self, log_type):
+        return [{"timestamp": 1, "level": "SEVERE", "message": "boom"}]
+
+
+@pytest.fixture
+def collector():
+    """
+    Start a private capture and restore the one opened by conftest afterwards.
+    """
+    previous = artifacts.current_collector()
+    yield artifacts.start_capture("tests/unit/test_x.py::test_case[param]")
+    artifacts._active_collector = previous
+
+
+def test_ring_buffer_is_bounded():
+    collector = ArtifactCollector("bounded", buffer_size=3)
+    for i in range(10):
+        collector.record_action("click", ("id", f"el{i}"), 0.001)
+
+    assert len(collector.events) == 3
+    assert collector.events[0][3] == ("id", "el7")
+
+
+def test_base_page_records_actions_and_driver(collector):
+    driver = DummyDriver()
+    base_page = BasePage(driver)
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        base_page.click(("id", "submit"))
+
+    assert collector.drivers == [driver]
+    actions = [event for event in collector.events if event[0] == "action"]
+    assert actions[-1][2] == "click"
+    assert actions[-1][3] == ("id", "submit")
+
+
+def test_log_records_are_buffered(collector):
+    get_logger("test_log_records_are_buffered").info("hello buffer")
+
+    messages = [event[2].getMessage() for event in collector.events if event[0] == "log"]
+    assert "hello buffer" in messages
+
+
+def test_flush_writes_artifacts(collector, tmp_path):
+    collector.attach_driver(DummyDriver())
+    collector.record_action("navigate_to", None, 0.2, "about:blank")
+
+    artifact_dir = collector.flush(root=str(tmp_path))
+
+    assert os.path.basename(artifact_dir) == "tests_unit_test_x.py_test_case_param"
+    for name in ["timeline.log", "screenshot.png", "page_source.html", "console.log"]:
+        assert os.path.exists(os.path.join(artifact_dir, name))
+    with open(os.path.join(artifact_dir, "timeline.log")) as f:
+        assert "ACTION navigate_to" in f.read()
+    with open(os.path.join(artifact_dir, "console.log")) as f:
+        assert "SEVERE boom" in f.read()
+
+
+def test_flush_survives_driver_errors(collector, tmp_path):
+    class BrokenDriver:
+        @property
+        def page_source(self):
+            raise RuntimeError("session gone")
+
+        def save_screenshot(self, file_name):
+            raise RuntimeError("session gone")
+
+        def get_log(self, log_type):
+            raise RuntimeError("unsupported")
+
+    collector.attach_driver(BrokenDriver())
+
+    artifact_dir = collector.flush(root=str(tmp_path))
+
+    assert os.listdir(artifact_dir) == ["timeline.log"]
+
+
+def test_no_capture_without_active_collector():
+    previous = artifacts.current_collector()
+    artifacts.stop_capture()
+    try:
+        driver = MagicMock(name="Driver")
+        BasePage(driver).refresh_page()
+        driver.refresh.assert_called_once()
+        assert artifacts.current_collector() is None
+    finally:
+        artifacts._active_collector = previous
@@ -0,0 +1,152 @@
+import subprocess
+import sys
+import time
+import pytest
+from unittest.mock import MagicMock
+from src.drivers import driver_health
+from src.drivers.driver_health import DriverWatchdog
+from src.utils.logger import get_logger
+
+logger = get_logger("test_driver_health")
+
+
+class FakeProcess:
+    """
+    Minimal stand-in for psutil.Process with a fixed RSS.
+    """
+
+    def __init__(self, pid, rss_mb):
+        self.pid = pid
+        self.rss_mb = rss_mb
+        self.killed = False
+
+    def memory_info(self):
+        return MagicMock(rss=int(self.rss_mb * 1024 * 1024))
+
+    def cpu_percent(self):
+        return 1.0
+
+    def is_running(self):
+        return not self.killed
+
+    def kill(self):
+        self.killed = True
+
+
+def is_alive(process):
+    """
+    True while the process runs; orphans reaped by nobody stay as zombies and count as dead.
+    """
+    try:
+        return process.status() != driver_health.psutil.STATUS_ZOMBIE
+    except driver_health.psutil.NoSuchProcess:
+        return False
+
+
+def make_factory():
+    drivers = []
+
+    def factory():
+        driver = MagicMock(name=f"Driver{len(drivers)}")
+        drivers.append(driver)
+        return driver
+
+    return factory, drivers
+
+
+def test_healthy_session_is_reused():
+    factory, drivers = make_factory()
+    watchdog = DriverWatchdog(factory, ping_timeout=1)
+
+    first = watchdog.ensure_healthy()
+    second = watchdog.ensure_healthy()
+
+    assert first is second
+    assert len(drivers) == 1
+    assert watchdog.metrics["restarts"] == 0
+
+
+def test_crashed_session_is_replaced():
+    factory, drivers = make_factory()
+    watchdog = DriverWatchdog(factory, ping_timeout=1)
+    watchdog.ensure_healthy()
+    drivers[0].execute_script.side_effect = ConnectionRefusedError("browser gone")
+
+    driver = watchdog.ensure_healthy()
+
+    assert driver is drivers[1]
+    drivers[0].quit.assert_called_once()
+    assert watchdog.metrics["restarts"] == 1
+    assert watchdog.metrics["restart_reasons"][0].startswith("crashed")
+
+
+def test_hung_session_is_replaced_without_waiting_for_it():
+    factory, drivers = make_factory()
+    watchdog = DriverWatchdog(factory, ping_timeout=0.1)
+    watchdog.ensure_healthy()
+    drivers[0].execute_script.side_effect = lambda script: time.sleep(2)
+    drivers[0].quit.side_effect = lambda: time.sleep(2)
+
+    started = time.perf_counter()
+    driver = watchdog.ensure_healthy()
+    elapsed = time.perf_counter() - started
+    logger.info("Hung session replaced in %.2fs", elapsed)
+
+    assert driver is drivers[1]
+    assert elapsed < 1
+    assert watchdog.metrics["restart_reasons"][0].startswith("hung")
+
+
+def test_bloated_session_is_replaced_and_growth_recorded(monkeypatch):
+    factory, drivers = make_factory()
+    trees = {}
+    monkeypatch.setattr(driver_health, "psutil", MagicMock())
+    monkeypatch.setattr(driver_health, "process_tree", lambda driver: trees.get(id(driver), []))
+    watchdog = DriverWatchdog(factory, ping_timeout=1, max_rss_mb=500)
+
+    watchdog.ensure_healthy()
+    browser = FakeProcess(101, 300)
+    trees[id(drivers[0])] = [FakeProcess(100, 20), browser]
+    assert watchdog.check().healthy
+
+    browser.rss_mb = 700
+    driver = watchdog.ensure_healthy()
+
+    assert driver is drivers[1]
+    assert browser.killed
+    assert watchdog.metrics["peak_rss_mb"] == pytest.approx(720)
+    assert watchdog.metrics["rss_growth_mb"] == [pytest.approx(400)]
+    assert "rss 720 MB over limit" in watchdog.metrics["restart_reasons"][0]
+    assert "restarts=1" in watchdog.summary()
+
+
+@pytest.mark.skipif(driver_health.psutil is None, reason="psutil is not installed")
+def test_process_tree_includes_children_and_kill_reaps_them():
+    parent = subprocess.Popen([
+        sys.executable, "-c",
+        "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)",
+    ])
+    driver = MagicMock(name="LocalDriver")
+    driver.service.process = parent
+    try:
+        # Wait until both processes are started and idle in their sleep.
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            tree = driver_health.process_tree(driver)
+            if len(tree) == 2 and all(p.status() == driver_health.psutil.STATUS_SLEEPING for p in tree):
+                break
+            time.sleep(0.05)
+        processes = driver_health.process_tree(driver)
+        assert len(processes) == 2
+
+        watchdog = DriverWatchdog(lambda: driver, ping_timeout=1)
+        watchdog.ensure_healthy()
+        watchdog.quit()
+        parent.wait(timeout=5)
+        deadline = time.time() + 5
+        while any(is_alive(process) for process in processes) and time.time() < deadline:
+            time.sleep(0.05)
+        assert not any(is_alive(process) for process in processes)
+    finally:
+        if parent.poll() is None:
+            parent.kill()
@@ -0,0 +1,113 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from src.pages.base_page import BasePage
+from src.pages.element import Element
+
+
+class LoginPage(BasePage):
+    username = Element(By.ID, "user")
+    password = Element(By.NAME, "pass")
+    errors = Element(By.CSS_SELECTOR, ".error", many=True)
+
+
+class AdminLoginPage(LoginPage):
+    token = Element(By.XPATH, "//input[@data-testid='token']")
+
+
+def test_class_metadata_compiled_once():
+    assert list(LoginPage._elements) == ["username", "password", "errors"]
+    assert list(AdminLoginPage._elements) == ["username", "password", "errors", "token"]
+    assert AdminLoginPage._prefetch_specs[-1] == ["xpath", "//input[@data-testid='token']", False]
+    assert BasePage._elements == {}
+
+
+def test_element_is_usable_as_locator_tuple():
+    assert LoginPage.username == (By.ID, "user")
+    by, value = LoginPage.password
+    assert (by, value) == ("name", "pass")
+
+
+def test_invalid_strategy_rejected_at_class_creation():
+    with pytest.raises(ValueError):
+        class BrokenPage(BasePage):
+            bad = Element("magic", "x")
+
+
+def test_lazy_resolution_is_cached_per_instance():
+    page = LoginPage(MagicMock(name="Driver"))
+    fake_element = MagicMock(name="UserField")
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        instance = MockWebDriverWait.return_value
+        instance.until.return_value = fake_element
+
+        assert page.username is fake_element
+        assert page.username is fake_element
+        instance.until.assert_called_once()
+
+        other_page = LoginPage(MagicMock(name="OtherDriver"))
+        other_page.username
+        assert instance.until.call_count == 2
+
+
+def test_navigation_invalidates_cache():
+    page = LoginPage(MagicMock(name="Driver"))
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        instance = MockWebDriverWait.return_value
+        instance.until.side_effect = [MagicMock(name="First"), MagicMock(name="Second")]
+
+        first = page.username
+        page.navigate_to("https://example.com/next")
+        second = page.username
+
+    assert first is not second
+
+
+def test_prefetch_resolves_all_in_one_script_call():
+    driver = MagicMock(name="Driver")
+    user, error = MagicMock(name="User"), MagicMock(name="Error")
+    driver.execute_script.return_value = {"elements": [user, None, [error]], "document": MagicMock(name="Html")}
+    page = LoginPage(driver)
+
+    cached = page.prefetch_elements()
+
+    assert cached == 2
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args[0][1] == [
+        ["id", "user", False], ["name", "pass", False], ["css selector", ".error", True]
+    ]
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        assert page.username is user
+        assert page.errors == [error]
+        MockWebDriverWait.assert_not_called()
+
+
+def test_stale_cached_element_is_resolved_again():
+    page = LoginPage(MagicMock(name="Driver"))
+    first, second = MagicMock(name="First"), MagicMock(name="Second")
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.side_effect = [first, second]
+        assert page.username is first
+        # e.g. a click on the element submitted a form and the browser loaded a new document
+        first.is_enabled.side_effect = StaleElementReferenceException("stale")
+        assert page.username is second
+
+
+def test_prefetch_caches_empty_lists_until_the_document_changes():
+    driver = MagicMock(name="Driver")
+    document = MagicMock(name="Html")
+    driver.execute_script.return_value = {"elements": [None, None, []], "document": document}
+    page = LoginPage(driver)
+
+    assert page.prefetch_elements() == 1
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        assert page.errors == []
+        MockWebDriverWait.assert_not_called()
+
+        document.is_enabled.side_effect = StaleElementReferenceException("stale")
+        MockWebDriverWait.return_value.until.return_value = [MagicMock(name="Error")]
+        assert len(page.errors) == 1
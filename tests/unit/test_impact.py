@@ -0,0 +1,211 @@
+import os
+import subprocess
+import pytest
+from unittest.mock import MagicMock, patch
+from openpyxl import Workbook
+from src.pages.base_page import BasePage
+from src.utils import impact
+from src.utils.excel_reader import ExcelReader
+from src.utils.impact import DependencyIndex, ImpactTracker
+
+
+class CheckoutPage(BasePage):
+    pass
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """
+    Private tracker rooted at the project; restores the session tracker afterwards.
+    """
+    previous = impact.current_tracker()
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    tracker = impact.enable_tracking(project_root)
+    yield tracker
+    impact._active_tracker = previous
+
+
+def make_workbook(path, sheets):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+
+
+def test_tracker_records_pages_locators_and_sheets(tracker, tmp_path):
+    workbook = tmp_path / "users.xlsx"
+    make_workbook(workbook, {"Users": [["name"], ["alice"]], "Orders": [["id"]]})
+
+    tracker.start_test("tests/unit/test_checkout.py::test_pay")
+    page = CheckoutPage(MagicMock(name="Driver"))
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        page.click(("css selector", "#pay"))
+    ExcelReader(str(workbook)).get_sheet_data("Users")
+    tracker.stop_test()
+
+    record = tracker.records["tests/unit/test_checkout.py::test_pay"]
+    assert record["pages"] == {f"{CheckoutPage.__module__}.CheckoutPage"}
+    assert {"src/pages/base_page.py", "tests/unit/test_impact.py"} <= record["files"]
+    assert record["locators"] == {"css selector=#pay"}
+    # The workbook lives outside the project root.
+    assert record["sheets"] == {}
+
+
+def test_tracker_records_sheets_inside_the_root(tmp_path):
+    previous = impact.current_tracker()
+    tracker = impact.enable_tracking(str(tmp_path))
+    try:
+        make_workbook(tmp_path / "users.xlsx", {"Users": [["name"], ["alice"]], "Orders": [["id"]]})
+        tracker.start_test("tests/test_data.py::test_users")
+        ExcelReader(str(tmp_path / "users.xlsx")).get_sheet_data("Users")
+        tracker.stop_test()
+    finally:
+        impact._active_tracker = previous
+
+    assert tracker.records["tests/test_data.py::test_users"]["sheets"] == {"users.xlsx": {"Users"}}
+
+
+def test_nothing_recorded_outside_a_test(tracker):
+    CheckoutPage(MagicMock(name="Driver"))
+    assert tracker.records == {}
+
+
+def make_index():
+    tracker = ImpactTracker()
+    records = {
+        "tests/ui/test_login.py::test_ok": {
+            "pages": {"pages.LoginPage"}, "files": {"src/pages/base_page.py", "pages/login.py"},
+            "locators": {"id=user"}, "sheets": {"data/users.xlsx": {"Users"}},
+        },
+        "tests/ui/test_cart.py::test_add": {
+            "pages": {"pages.CartPage"}, "files": {"src/pages/base_page.py", "pages/cart.py"},
+            "locators": {"id=add"}, "sheets": {"data/users.xlsx": {"Orders"}},
+        },
+        "tests/ui/test_cart.py::test_remove": {
+            "pages": {"pages.CartPage"}, "files": {"src/pages/base_page.py", "pages/cart.py"},
+            "locators": {"id=remove"}, "sheets": {},
+        },
+    }
+    tracker.records = records
+    index = DependencyIndex()
+    index.update(records)
+    return index
+
+
+def test_page_module_change_selects_its_tests():
+    index = make_index()
+    assert index.affected(["pages/cart.py"]) == {"tests/ui/test_cart.py::test_add", "tests/ui/test_cart.py::test_remove"}
+    assert index.affected(["src/pages/base_page.py"]) == set(index.tests)
+
+
+def test_shared_page_modules_select_every_test():
+    index = make_index()
+    # A test of BasePage class creation that never instantiated a page object.
+    index.tests["tests/unit/test_element.py::test_class_metadata"] = {
+        "pages": [], "files": [], "locators": [], "sheets": {}}
+    for path in ["src/pages/base_page.py", "src/pages/element.py"]:
+        assert index.affected([path]) == set(index.tests)
+
+
+def test_prune_drops_removed_tests(tmp_path):
+    index = make_index()
+    os.makedirs(tmp_path / "tests" / "ui")
+    (tmp_path / "tests" / "ui" / "test_cart.py").write_text("")
+
+    # test_cart.py was collected without test_remove; test_login.py no longer exists.
+    removed = index.prune(["tests/ui/test_cart.py::test_add"], str(tmp_path))
+
+    assert removed == 2
+    assert list(index.tests) == ["tests/ui/test_cart.py::test_add"]
+
+
+def test_prune_keeps_tests_of_modules_narrowed_to_node_ids(tmp_path):
+    index = make_index()
+    os.makedirs(tmp_path / "tests" / "ui")
+    for name in ["test_login.py", "test_cart.py"]:
+        (tmp_path / "tests" / "ui" / name).write_text("")
+
+    # pytest tests/ui/test_cart.py::test_add
+    removed = index.prune(["tests/ui/test_cart.py::test_add"], str(tmp_path), narrowed={"tests/ui/test_cart.py"})
+
+    assert removed == 0
+    assert len(index.tests) == 3
+
+
+def test_prune_keeps_tests_of_modules_not_collected(tmp_path):
+    index = make_index()
+    for name in ["test_login.py", "test_cart.py"]:
+        os.makedirs(tmp_path / "tests" / "ui", exist_ok=True)
+        (tmp_path / "tests" / "ui" / name).write_text("")
+
+    assert index.prune(["tests/ui/test_login.py::test_ok"], str(tmp_path)) == 0
+    assert len(index.tests) == 3
+
+
+def test_workbook_change_selects_by_sheet():
+    index = make_index()
+    assert index.affected(["data/users.xlsx"], {"data/users.xlsx": {"Orders"}}) == {"tests/ui/test_cart.py::test_add"}
+    assert index.affected(["data/users.xlsx"]) == {"tests/ui/test_login.py::test_ok", "tests/ui/test_cart.py::test_add"}
+
+
+def test_test_module_unknown_python_and_new_tests():
+    index = make_index()
+    assert index.affected(["tests/ui/test_login.py"]) == {"tests/ui/test_login.py::test_ok"}
+    assert index.affected(["README.md"]) == set()
+    assert index.affected(["src/utils/logger.py"]) == set(index.tests)
+
+
+def test_untracked_file_types_select_every_test():
+    index = make_index()
+    for path in ["tests/fixtures/login.html", "requirements.txt", "pytest.ini", "data/users.csv"]:
+        assert index.affected([path]) == set(index.tests)
+    assert index.affected([], nodeids=list(index.tests) + ["tests/ui/test_new.py::test_x"]) == {"tests/ui/test_new.py::test_x"}
+
+
+def test_index_updates_incrementally(tmp_path):
+    path = str(tmp_path / "impact" / "index.json")
+    make_index().save(path)
+
+    tracker = ImpactTracker()
+    tracker.records = {"tests/ui/test_cart.py::test_add": {"pages": set(), "files": {"pages/other.py"},
+                                                           "locators": set(), "sheets": {}}}
+    index = DependencyIndex.load(path)
+    index.update(tracker.records)
+    index.save(path)
+
+    reloaded = DependencyIndex.load(path)
+    assert len(reloaded.tests) == 3
+    assert reloaded.tests["tests/ui/test_cart.py::test_add"]["files"] == ["pages/other.py"]
+
+
+def test_select_tests_from_git_changes(tmp_path):
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=tmp_path, check=True,
+                       capture_output=True)
+
+    os.makedirs(tmp_path / "pages")
+    (tmp_path / "pages" / "cart.py").write_text("CART = 1\n")
+    make_workbook(tmp_path / "users.xlsx", {"Users": [["alice"]], "Orders": [[1]]})
+    git("init", "-q")
+    git("add", "-A")
+    git("commit", "-qm", "base")
+
+    make_workbook(tmp_path / "users.xlsx", {"Users": [["bob"]], "Orders": [[1]]})
+    index = DependencyIndex()
+    tracker = ImpactTracker()
+    tracker.records = {
+        "tests/test_a.py::test_users": {"pages": set(), "files": set(), "locators": set(),
+                                        "sheets": {"users.xlsx": {"Users"}}},
+        "tests/test_a.py::test_orders": {"pages": set(), "files": set(), "locators": set(),
+                                         "sheets": {"users.xlsx": {"Orders"}}},
+        "tests/test_b.py::test_cart": {"pages": set(), "files": {"pages/cart.py"}, "locators": set(),
+                                       "sheets": {}},
+    }
+    index.update(tracker.records)
+
+    assert impact.changed_sheets("HEAD", "users.xlsx", str(tmp_path)) == {"Users"}
+    assert impact.select_tests("HEAD", index, list(index.tests), str(tmp_path)) == {"tests/test_a.py::test_users"}
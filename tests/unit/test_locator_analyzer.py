@@ -0,0 +1,137 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from src.pages.base_page import BasePage
+from src.utils import locator_analyzer
+from src.utils.locator_analyzer import LocatorAnalyzer
+from src.utils.logger import get_logger
+
+logger = get_logger("test_locator_analyzer")
+
+
+class LoginPage(BasePage):
+    pass
+
+
+PAGE = f"{__name__}.LoginPage"
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = locator_analyzer.enable_analysis(slow_threshold=0.5)
+    yield analyzer
+    locator_analyzer.disable_analysis()
+
+
+def make_driver(match_count=1, suggestion=None):
+    driver = MagicMock(name="Driver")
+    driver.find_elements.return_value = [MagicMock(name=f"el{i}") for i in range(match_count)]
+    driver.execute_script.return_value = suggestion
+    return driver
+
+
+def test_records_locator_with_match_count_and_suggestion(analyzer):
+    driver = make_driver(match_count=2, suggestion=["css selector", '[data-testid="login"]'])
+    page = LoginPage(driver)
+    locator = ("xpath", "//div[@id='main']/div/form/div[2]/button[contains(text(), 'Login')]")
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        page.click(locator)
+        page.click(locator)
+
+    stats = analyzer.stats[(PAGE, locator)]
+    assert stats.uses == 2
+    assert stats.match_count == 2
+    # The DOM is inspected only once per locator.
+    driver.find_elements.assert_called_once_with(*locator)
+    assert stats.suggestion == ("css selector", '[data-testid="login"]')
+    flags = analyzer.flags(stats)
+    logger.info("Flags: %s", flags)
+    assert {"ambiguous", "deep-xpath", "text-match"} <= set(flags)
+
+
+def test_id_locator_is_not_flagged(analyzer):
+    driver = make_driver()
+    page = LoginPage(driver)
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        page.find_element(("id", "user"))
+
+    stats = analyzer.stats[(PAGE, ("id", "user"))]
+    assert analyzer.flags(stats) == []
+    driver.execute_script.assert_not_called()
+
+
+def test_slow_and_absolute_xpath_flags():
+    analyzer = LocatorAnalyzer(slow_threshold=0.1)
+    page = LoginPage(make_driver())
+    locator = ("xpath", "/html/body/div")
+    analyzer.record(page, "find_element", locator, 0.3)
+
+    assert {"slow", "absolute-xpath"} <= set(analyzer.flags(analyzer.stats[(PAGE, locator)]))
+
+
+def test_find_elements_is_not_ambiguous():
+    analyzer = LocatorAnalyzer()
+    page = LoginPage(make_driver(match_count=5))
+    locator = ("css selector", "li.item")
+    analyzer.record(page, "find_elements", locator, 0.01)
+
+    assert analyzer.flags(analyzer.stats[(PAGE, locator)]) == []
+
+
+def test_write_reports_per_page_class(tmp_path):
+    analyzer = LocatorAnalyzer(slow_threshold=0.1)
+    analyzer.record(LoginPage(make_driver()), "click", ("name", "go"), 0.2)
+    analyzer.record(BasePage(make_driver()), "find_element", ("id", "x"), 0.01)
+
+    paths = analyzer.write_reports(str(tmp_path))
+
+    assert sorted(os.path.basename(p) for p in paths) == ["src.pages.base_page.BasePage.txt", f"{PAGE}.txt"]
+    with open(tmp_path / f"{PAGE}.txt") as f:
+        content = f.read()
+    assert "('name', 'go')" in content
+    assert "flags: slow" in content
+
+
+def test_disabled_analyzer_adds_no_driver_calls():
+    driver = MagicMock(name="Driver")
+    page = LoginPage(driver)
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        page.find_element(("xpath", "//div"))
+
+    driver.find_elements.assert_not_called()
+    driver.execute_script.assert_not_called()
+
+
+def test_click_is_inspected_before_it_changes_the_page(analyzer):
+    driver = make_driver(match_count=2, suggestion=["id", "submit"])
+    element = MagicMock(name="SubmitButton")
+    # Submitting the form navigates away: the locator no longer matches anything.
+    element.click.side_effect = lambda: setattr(driver.find_elements, "return_value", [])
+    page = LoginPage(driver)
+    locator = ("css selector", "form button")
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = element
+        page.click(locator)
+
+    stats = analyzer.stats[(PAGE, locator)]
+    assert stats.match_count == 2
+    assert stats.suggestion == ("id", "submit")
+    assert "ambiguous" in analyzer.flags(stats)
+    driver.find_elements.assert_called_once_with(*locator)
+
+
+def test_page_classes_with_the_same_name_are_kept_apart():
+    other = type("LoginPage", (BasePage,), {"__module__": "pages.admin"})
+    analyzer = LocatorAnalyzer()
+    locator = ("id", "user")
+    analyzer.record(LoginPage(make_driver()), "find_element", locator, 0.01)
+    analyzer.record(other(make_driver()), "find_element", locator, 0.01)
+
+    assert set(analyzer.stats) == {(PAGE, locator), ("pages.admin.LoginPage", locator)}
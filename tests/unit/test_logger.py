@@ -0,0 +1,31 @@
+import logging
+import os
+import subprocess
+import sys
+from src.utils.logger import configure_logging, get_logger
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def test_records_are_written_once_to_console_and_file():
+    configure_logging()
+    configure_logging()
+    first = get_logger("test_logger.once")
+    second = get_logger("test_logger.once")
+
+    root_handlers = [handler for handler in logging.getLogger().handlers
+                     if getattr(handler, "_automation_handler", False)]
+
+    assert first is second
+    assert first.handlers == []
+    assert len(root_handlers) == 2
+    assert {type(handler) for handler in root_handlers} == {logging.StreamHandler, logging.FileHandler}
+
+
+def test_get_logger_does_not_configure_logging():
+    code = ("import logging; from src.utils.logger import get_logger; get_logger('library'); "
+            "print(len(logging.getLogger().handlers), logging.getLogger().level)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True,
+                            check=True, env=dict(os.environ, PYTHONPATH=project_root))
+
+    assert result.stdout.split() == ["0", str(logging.WARNING)]
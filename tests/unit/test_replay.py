@@ -0,0 +1,177 @@
+import json
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from src.drivers.replay import ReplayDriver, ReplayMismatchError, record_commands
+from src.pages.base_page import BasePage
+from src.pages.element import Element
+from src.utils.logger import get_logger
+
+logger = get_logger("test_replay")
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class FakeBrowserExecutor:
+    """
+    Command executor answering like a browser showing a tiny login page.
+    """
+
+    def __init__(self, late_after=2):
+        self.calls = 0
+        self.title = "Login"
+        self.late_polls = 0
+        self.late_after = late_after
+
+    def execute(self, command, params):
+        self.calls += 1
+        if command == "newSession":
+            return {"value": {"sessionId": "fake-session", "capabilities": {"browserName": "fake"}}}
+        if command == "findElement":
+            if params["value"] in ("user", '[id="user"]'):
+                return {"value": {ELEMENT_KEY: "el-user"}}
+            if params["value"] in ("late", '[id="late"]'):
+                # Rendered only after `late_after` failed polls.
+                self.late_polls += 1
+                if self.late_polls > self.late_after:
+                    return {"value": {ELEMENT_KEY: "el-late"}}
+            # Error bodies are passed through as raw JSON text, like RemoteConnection does.
+            error = {"error": "no such element", "message": "not found", "stacktrace": ""}
+            return {"status": 404, "value": json.dumps({"value": error})}
+        if command == "clickElement":
+            self.title = "Dashboard"
+        if command == "getTitle":
+            return {"value": self.title}
+        if command == "getElementText":
+            return {"value": "alice"}
+        if command in ("w3cExecuteScript", "isElementEnabled"):
+            # Visibility atom and enabled state used by element_to_be_clickable.
+            return {"value": True}
+        return {"value": None}
+
+    def close(self):
+        pass
+
+
+class LoginPage(BasePage):
+    username = Element(By.ID, "user")
+
+    def login(self, name):
+        self.enter_text(LoginPage.username, name)
+        self.click(LoginPage.username)
+        return self.get_title()
+
+
+def exercise(driver):
+    page = LoginPage(driver, timeout=0.2)
+    results = [page.get_title(), page.login("alice"), page.get_text(LoginPage.username)]
+    with pytest.raises(TimeoutException):
+        page.find_element(("id", "missing"))
+    return results
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = str(tmp_path / "login.jsonl.gz")
+    executor = FakeBrowserExecutor()
+    driver = WebDriver(command_executor=executor, options=ArgOptions())
+    record_commands(driver, path)
+    results = exercise(driver)
+    driver.quit()
+    return path, results
+
+
+def test_replay_reproduces_recorded_run(recording):
+    path, recorded_results = recording
+
+    driver = ReplayDriver(path)
+    assert driver.session_id == "fake-session"
+    assert exercise(driver) == recorded_results == ["Login", "Dashboard", "alice"]
+    driver.quit()
+
+
+def test_replay_is_fast(recording):
+    path, _ = recording
+
+    started = time.perf_counter()
+    for _ in range(20):
+        driver = ReplayDriver(path)
+        page = LoginPage(driver)
+        page.get_title()
+        page.login("alice")
+    elapsed = time.perf_counter() - started
+    logger.info("20 replayed logins took %.4fs", elapsed)
+
+    assert elapsed < 1
+
+
+def test_replay_rejects_diverging_commands(recording):
+    path, _ = recording
+
+    driver = ReplayDriver(path)
+    with pytest.raises(ReplayMismatchError):
+        LoginPage(driver).login("bob")
+
+
+def test_replay_rejects_repeated_non_polling_commands(recording):
+    path, _ = recording
+
+    driver = ReplayDriver(path)
+    page = LoginPage(driver)
+    page.get_title()
+    page.enter_text(LoginPage.username, "alice")
+    page.click(LoginPage.username)
+    with pytest.raises(ReplayMismatchError):
+        # A double click regression: the recording clicked once.
+        WebElement(driver, "el-user").click()
+
+
+def exercise_waits(driver):
+    page = BasePage(driver, timeout=1)
+    page.find_element(("id", "late"))
+    with pytest.raises(TimeoutException):
+        page.find_element(("id", "missing"), timeout=0.4)
+
+
+@pytest.fixture(scope="module")
+def polling_recording(tmp_path_factory):
+    """
+    A recording of a wait that polled three times and of a wait that timed out.
+    """
+    path = str(tmp_path_factory.mktemp("replay") / "waits.jsonl")
+    driver = WebDriver(command_executor=FakeBrowserExecutor(), options=ArgOptions())
+    record_commands(driver, path)
+    started = time.perf_counter()
+    exercise_waits(driver)
+    elapsed = time.perf_counter() - started
+    driver.quit()
+    return path, elapsed
+
+
+def test_replay_of_retries_and_timeouts_takes_no_real_time(polling_recording):
+    path, recorded = polling_recording
+
+    driver = ReplayDriver(path)
+    started = time.perf_counter()
+    exercise_waits(driver)
+    elapsed = time.perf_counter() - started
+    driver.quit()
+    logger.info("Waits took %.3fs when recorded and %.4fs when replayed", recorded, elapsed)
+
+    assert recorded > 1.0
+    assert elapsed < 0.1
+
+
+def test_live_waits_keep_real_time(polling_recording):
+    path, _ = polling_recording
+    ReplayDriver(path)  # installs the replay clock
+    driver = WebDriver(command_executor=FakeBrowserExecutor(late_after=1), options=ArgOptions())
+
+    started = time.perf_counter()
+    BasePage(driver, timeout=1).find_element(("id", "late"))
+
+    assert time.perf_counter() - started > 0.4
@@ -0,0 +1,132 @@
+import json
+import time
+import tracemalloc
+import pytest
+from unittest.mock import MagicMock, patch
+from src.pages.base_page import BasePage
+from src.utils import run_events
+from src.utils.run_events import read_events
+from src.utils.report_builder import ReportBuilder
+from src.utils.logger import get_logger
+
+logger = get_logger("test_run_events")
+
+
+@pytest.fixture
+def stream(tmp_path):
+    """
+    Start a private event stream and restore the one opened by conftest afterwards.
+    """
+    previous = run_events.current_stream()
+    stream = run_events.start_stream(str(tmp_path / "events" / "events.jsonl"))
+    yield stream
+    if not stream.file.closed:
+        stream.file.close()
+    run_events._active_stream = previous
+
+
+def test_events_are_compact_json_lines(stream):
+    stream.session_start()
+    stream.test_start("t::ok")
+    stream.action("click", ("id", "submit"), 0.123456)
+    stream.test_finish("t::ok", "passed", 1.5)
+
+    with open(stream.path) as events:
+        lines = events.read().splitlines()
+    assert all(": " not in line and ", " not in line for line in lines)
+    events = [json.loads(line) for line in lines]
+    assert [event["event"] for event in events] == ["session_start", "test_start", "action", "test_finish"]
+    assert events[2]["locator"] == ["id", "submit"]
+    assert events[2]["duration"] == 0.1235
+    assert "detail" not in events[2]
+
+
+def test_finished_tests_are_on_disk_before_the_stream_is_closed(stream):
+    stream.test_start("t::a")
+    stream.test_finish("t::a", "failed", 0.5, "AssertionError")
+
+    assert [event["event"] for event in read_events(stream.path)] == ["test_start", "test_finish"]
+
+
+def test_base_page_streams_actions_and_screenshots(stream):
+    driver = MagicMock(name="driver")
+    base_page = BasePage(driver)
+    stream.test_start("t::page")
+
+    with patch("src.pages.base_page.WebDriverWait") as MockWebDriverWait:
+        MockWebDriverWait.return_value.until.return_value = MagicMock(name="FakeElement")
+        base_page.click(("id", "submit"))
+    base_page.take_screenshot("shot.png")
+    stream.file.flush()
+
+    events = list(read_events(stream.path))
+    assert events[1]["event"] == "action" and events[1]["action"] == "click"
+    assert events[1]["test"] == "t::page"
+    assert events[-1] == {"event": "artifact", "ts": events[-1]["ts"], "test": "t::page",
+                          "kind": "screenshot", "path": "reports/screenshots/shot.png"}
+
+
+def test_report_summarizes_run_and_details_failures(stream, tmp_path):
+    artifact_dir = tmp_path / "artifacts" / "t_broken"
+    artifact_dir.mkdir(parents=True)
+    (artifact_dir / "screenshot.png").write_bytes(b"png")
+    (artifact_dir / "timeline.log").write_text("...")
+
+    stream.session_start()
+    stream.test_start("t::ok")
+    stream.action("click", ("id", "a"), 0.2)
+    stream.test_finish("t::ok", "passed", 1.0)
+    stream.test_start("t::broken")
+    stream.action("type_text", ("id", "<name>"), 0.1)
+    stream.artifact("t::broken", "failure", str(artifact_dir))
+    stream.test_finish("t::broken", "failed", 3.0, "AssertionError: <boom>")
+    stream.test_start("t::crashed")
+    stream.close()
+
+    report_path = tmp_path / "html" / "report.html"
+    outcomes = ReportBuilder(stream.path).build(str(report_path))
+
+    report = report_path.read_text()
+    assert outcomes == {"passed": 1, "failed": 1, "interrupted": 1}
+    assert "AssertionError: &lt;boom&gt;" in report
+    assert "(&#x27;id&#x27;, &#x27;&lt;name&gt;&#x27;)" in report
+    assert '<img src="../artifacts/t_broken/screenshot.png"' in report
+    assert 'href="../artifacts/t_broken/timeline.log"' in report
+    assert report.index("t::broken (3.00s)") < report.index("<h2>All tests</h2>")
+    assert list((tmp_path / "html").iterdir()) == [report_path]
+
+
+def test_report_skips_truncated_last_line(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"event":"test_start","ts":1,"test":"t::a"}\n'
+                    '{"event":"test_finish","ts":2,"test":"t::a","outcome":"passed","duration":1}\n'
+                    '{"event":"test_sta')
+
+    assert ReportBuilder(str(path)).build(str(tmp_path / "report.html")) == {"passed": 1}
+
+
+def test_report_uses_bounded_memory(tmp_path):
+    # benchmarks/report_memory.py runs the same check on 100k tests.
+    path = tmp_path / "events.jsonl"
+    with open(path, "w") as events:
+        for i in range(5_000):
+            test = f"tests/test_bulk.py::test_case[{i}]"
+            events.write(json.dumps({"event": "test_start", "ts": i, "test": test}) + "\n")
+            for action in ("navigate_to", "click", "type_text"):
+                events.write(json.dumps({"event": "action", "ts": i, "test": test, "action": action,
+                                         "locator": ["id", "field"], "duration": 0.01}) + "\n")
+            events.write(json.dumps({"event": "test_finish", "ts": i, "test": test,
+                                     "outcome": "failed" if i % 1000 == 0 else "passed",
+                                     "duration": (i % 97) / 10, "message": "boom" if i % 1000 == 0 else None}) + "\n")
+
+    started = time.perf_counter()
+    tracemalloc.start()
+    outcomes = ReportBuilder(str(path)).build(str(tmp_path / "report.html"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info("Built report of 5k tests in %.1fs, peak memory %.1f MB",
+                time.perf_counter() - started, peak / 2 ** 20)
+
+    assert outcomes == {"passed": 4_995, "failed": 5}
+    assert path.stat().st_size > peak
+    assert peak < 2 ** 20
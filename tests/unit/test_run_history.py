@@ -0,0 +1,139 @@
+import pytest
+from src.utils.run_history import RunHistory, hash_shards, parse_shard
+from src.utils.logger import get_logger
+
+logger = get_logger("test_run_history")
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RunHistory(str(tmp_path / "history" / "history.db"))
+    yield history
+    history.close()
+
+
+def add_run(history, results):
+    run_id = history.start_run()
+    for nodeid, (outcome, duration, *rest) in results.items():
+        history.record(run_id, nodeid, outcome, duration, *rest)
+    history.finish_run(run_id)
+
+
+def test_stats_durations_flakiness_and_last_failure(history):
+    add_run(history, {"t::a": ("passed", 1.0), "t::b": ("passed", 2.0, 5)})
+    add_run(history, {"t::a": ("failed", 3.0, 0, "AssertionError: boom"), "t::b": ("passed", 4.0, 7)})
+    add_run(history, {"t::a": ("passed", 2.0), "t::b": ("skipped", 0.0, 0)})
+
+    stats = history.stats()
+
+    assert stats["t::a"].durations == [1.0, 3.0, 2.0]
+    assert stats["t::a"].flakiness == pytest.approx(1.0)
+    assert stats["t::a"].last_failure[1] == "AssertionError: boom"
+    assert stats["t::b"].average_duration == pytest.approx(3.0)
+    assert stats["t::b"].flakiness == 0.0
+    assert stats["t::b"].page_actions == pytest.approx(4)
+
+
+def test_results_survive_a_run_that_never_finished(tmp_path):
+    path = str(tmp_path / "history.db")
+    crashed = RunHistory(path)
+    run_id = crashed.start_run()
+    crashed.record(run_id, "t::a", "failed", 2.0, 0, "killed")
+    # No finish_run(): the process was killed.
+
+    other = RunHistory(path)
+    assert other.stats()["t::a"].outcomes == ["failed"]
+    other.close()
+    crashed.close()
+
+
+def test_history_persists_between_connections(tmp_path):
+    path = str(tmp_path / "history.db")
+    first = RunHistory(path)
+    add_run(first, {"t::a": ("passed", 1.5)})
+    first.close()
+
+    second = RunHistory(path)
+    assert second.stats()["t::a"].durations == [1.5]
+    second.close()
+
+
+def test_fail_fast_order(history):
+    add_run(history, {"t::slow": ("passed", 9.0), "t::fast": ("passed", 0.1), "t::broken": ("passed", 5.0),
+                      "t::older_failure": ("failed", 7.0)})
+    add_run(history, {"t::slow": ("passed", 9.0), "t::fast": ("passed", 0.1), "t::broken": ("failed", 5.0),
+                      "t::older_failure": ("passed", 7.0)})
+
+    ordered = history.order_fail_fast(["t::slow", "t::new", "t::fast", "t::older_failure", "t::broken"])
+    logger.info("Fail-fast order: %s", ordered)
+
+    # Latest failure first, then by duration; unknown tests count as median-length (6s).
+    assert ordered == ["t::broken", "t::older_failure", "t::fast", "t::new", "t::slow"]
+
+
+def test_shards_are_packed_longest_first(history):
+    durations = {"t::a": 8.0, "t::b": 7.0, "t::c": 6.0, "t::d": 5.0, "t::e": 4.0, "t::f": 2.0}
+    add_run(history, {nodeid: ("passed", duration) for nodeid, duration in durations.items()})
+
+    shards = history.shards(list(durations), 2, history.latest_run())
+
+    totals = [sum(durations[nodeid] for nodeid in shard) for shard in shards]
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(durations)
+    assert abs(totals[0] - totals[1]) <= 2.0
+    assert shards[0][0] == "t::a"
+
+
+def test_trend_report_lists_page_heavy_tests(history):
+    for duration in [1.0, 1.1, 2.0, 2.2]:
+        add_run(history, {"t::ui": ("passed", duration, 12), "t::pure": ("passed", duration, 0)})
+
+    report = history.trend_report(min_page_actions=1)
+
+    assert "t::ui" in report
+    assert "t::pure" not in report
+    assert "change=+" in report
+
+
+def test_shards_stay_consistent_while_shards_record_results(history):
+    nodeids = [f"t::test_{i}" for i in range(20)]
+    add_run(history, {nodeid: ("passed", 1.0 + i) for i, nodeid in enumerate(nodeids)})
+    base_run = history.latest_run()
+
+    first = history.shards(nodeids, 2, base_run)[0]
+    # Shard 1 runs and records very different durations before shard 2 computes its split.
+    add_run(history, {nodeid: ("passed", 100.0 - i) for i, nodeid in enumerate(first)})
+    second = history.shards(nodeids, 2, base_run)[1]
+
+    assert sorted(first + second) == sorted(nodeids)
+
+
+def test_shards_without_base_run_split_by_hash(history):
+    nodeids = [f"t::test_{i}" for i in range(20)]
+    before = history.shards(nodeids, 3)
+    add_run(history, {nodeid: ("passed", float(i)) for i, nodeid in enumerate(nodeids)})
+
+    assert history.shards(nodeids, 3) == before
+    assert sorted(nodeid for shard in before for nodeid in shard) == sorted(nodeids)
+
+
+def test_shards_reject_unknown_base_run(history):
+    with pytest.raises(ValueError):
+        history.shards(["t::a"], 2, base_run=42)
+
+
+def test_hash_shards_need_no_history():
+    nodeids = [f"t::test_{i}" for i in range(20)]
+    shards = hash_shards(nodeids, 3)
+
+    assert shards == hash_shards(list(reversed(nodeids)), 3)
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(nodeids)
+
+
+@pytest.mark.parametrize("value", ["0/2", "3/2", "1/0", "2", "a/b", "1/2/3"])
+def test_parse_shard_rejects_bad_values(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+from src.drivers import session_hygiene
+from src.drivers.driver_health import DriverWatchdog
+from src.drivers.session_hygiene import HygienePolicy, SessionHygiene, close_extra_tabs, clear_browser_storage
+from src.pages.base_page import BasePage
+
+
+def make_watchdog(policy):
+    drivers = []
+
+    def factory():
+        driver = MagicMock(name=f"Driver{len(drivers)}")
+        drivers.append(driver)
+        return driver
+
+    hygiene = SessionHygiene(policy)
+    return DriverWatchdog(factory, ping_timeout=1, hygiene=hygiene), hygiene, drivers
+
+
+def test_restart_after_navigations():
+    watchdog, hygiene, drivers = make_watchdog(HygienePolicy(restart_after_navigations=3))
+    try:
+        for _ in range(2):
+            page = BasePage(watchdog.ensure_healthy())
+            page.navigate_to("http://localhost/a")
+            page.refresh_page()
+
+        assert hygiene.navigations == 4
+        driver = watchdog.ensure_healthy()
+
+        assert driver is drivers[1]
+        assert hygiene.navigations == 0
+        assert "navigations" in watchdog.metrics["restart_reasons"][0]
+    finally:
+        watchdog.quit()
+    assert session_hygiene.current_hygiene() is None
+
+
+def test_navigations_of_other_drivers_are_ignored():
+    watchdog, hygiene, drivers = make_watchdog(HygienePolicy(restart_after_navigations=1))
+    try:
+        watchdog.ensure_healthy()
+        BasePage(MagicMock(name="UnrelatedDriver")).navigate_to("http://localhost/b")
+        assert hygiene.navigations == 0
+    finally:
+        watchdog.quit()
+
+
+def test_rss_limit_is_passed_to_watchdog():
+    watchdog, _, _ = make_watchdog(HygienePolicy(restart_above_rss_mb=800))
+    assert watchdog.max_rss_mb == 800
+
+
+def test_periodic_tab_closing_and_storage_clearing():
+    watchdog, hygiene, drivers = make_watchdog(HygienePolicy(close_tabs_every=2, clear_storage_every=3))
+    try:
+        watchdog.ensure_healthy()
+        drivers[0].window_handles = ["main", "popup1", "popup2"]
+        for _ in range(5):
+            watchdog.ensure_healthy()
+
+        # Six tests: tabs closed after tests 2, 4 and 6, storage cleared after tests 3 and 6.
+        assert hygiene.metrics == {"tabs_closed": 6, "storage_clears": 2}
+        assert "tabs_closed=6" in watchdog.summary()
+    finally:
+        watchdog.quit()
+
+
+def test_close_extra_tabs_keeps_first_window():
+    driver = MagicMock(name="Driver")
+    driver.window_handles = ["main", "popup"]
+
+    assert close_extra_tabs(driver) == 1
+    driver.close.assert_called_once()
+    assert driver.switch_to.window.call_args_list[-1][0][0] == "main"
+
+
+def test_clear_storage_uses_cdp_for_http_origin():
+    driver = MagicMock(name="ChromeDriver")
+    driver.execute_script.return_value = "http://127.0.0.1:8000"
+
+    clear_browser_storage(driver)
+
+    commands = [call[0][0] for call in driver.execute_cdp_cmd.call_args_list]
+    assert commands == ["Network.clearBrowserCache", "Network.clearBrowserCookies", "Storage.clearDataForOrigin"]
+    driver.delete_all_cookies.assert_not_called()
+
+
+def test_clear_storage_falls_back_without_cdp():
+    class FirefoxLike:
+        def __init__(self):
+            self.cookies_deleted = False
+
+        def execute_script(self, script):
+            return "http://127.0.0.1:8000"
+
+        def delete_all_cookies(self):
+            self.cookies_deleted = True
+
+    driver = FirefoxLike()
+    clear_browser_storage(driver)
+    assert driver.cookies_deleted